@@ -508,12 +508,13 @@ class CVD(object):
             cols.to("sRGB")
 
         # Transform color
-        from numpy import dot, vstack
-        RGB = vstack([cols.get("R"), cols.get("G"), cols.get("B")])
+        from numpy import vstack
+        RGB = vstack([cols.get(x, copy = False) for x in ("R", "G", "B")])
         CVD = self._interpolate_cvd_transform()
 
-        # Apply coefficients/CVD transformation matrix
-        RGB = RGB.transpose().dot(CVD).transpose()
+        # Apply coefficients/CVD transformation matrix; works on the
+        # (3, n) array directly without transposing the data back and forth.
+        RGB = CVD.T @ RGB
 
         # Save simulated data
         cols.set(R = RGB[0], G = RGB[1], B = RGB[2])
@@ -667,8 +668,7 @@ def desaturate(cols, amount = 1.):
     elif isinstance(cols, list) or isinstance(cols, str):
         cols = hexcols(cols)
     elif not isinstance(cols, colorobject):
-        import inspect
-        raise TypeError(f"argument `cols` to {inspect.stack()[0][3]} not among the allowed types.")
+        raise TypeError("argument `cols` to desaturate not among the allowed types.")
 
     # From here on "col" needs to be a colorspace.colorlib.colorobject
     if not isinstance(cols, colorobject):
@@ -689,16 +689,12 @@ def desaturate(cols, amount = 1.):
     cols = deepcopy(cols)
     cols.to("HCL")
 
-    # Desaturation
-    x = (1. - amount) * cols.get("C")
-    cols.set(C = (1. - amount) * cols.get("C"))
-
+    # Desaturation; black and white have neither chroma nor hue
     from numpy import where, logical_or
-    idx = where(logical_or(cols.get("L") <= 0, cols.get("L") >= 100))[0]
-    if len(idx) > 0:
-        C = cols.get("C"); C[idx] = 0
-        H = cols.get("H"); H[idx] = 0
-        cols.set(C = C, H = H)
+    L    = cols.get("L", copy = False)
+    kill = logical_or(L <= 0, L >= 100)
+    cols.set(C = where(kill, 0., (1. - amount) * cols.get("C", copy = False)),
+             H = where(kill, 0., cols.get("H", copy = False)))
 
     cols.to(original_class)
 
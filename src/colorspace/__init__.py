@@ -16,6 +16,7 @@ from .colorlib import HSV
 from .colorlib import HLS
 from .colorlib import hexcols
 from .colorlib import compare_colors
+from .colorlib import batch_to
 
 # Color vision deficiency functions.
 from .CVD import tritan
@@ -1,6 +1,24 @@
 
-import sys
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from inspect import signature, Parameter
 from tkinter import *
+from weakref import WeakKeyDictionary
+
+from . import palettes, CVD, demos
+from .colorlib import hexcols
+
+# Palette methods (see palconfig files) and CVD functions available in the GUI
+_PALETTE_FUNS = {x: getattr(palettes, x) for x in \
+                 ("diverging_hcl", "divergingx_hcl", "qualitative_hcl", "sequential_hcl")}
+_CVD_FUNS     = {x: getattr(CVD, x) for x in ("deutan", "protan", "tritan")}
+
+# Patterns used by Slider.isValidFloat to validate the user input;
+# compiled once as the validator runs on every keystroke.
+_FLOAT_POS_RE = re.compile(r"[0-9]+(\.|\.[0-9])?$")
+_FLOAT_NEG_RE = re.compile(r"-?[0-9]+(\.|\.[0-9])?$")
 
 # -------------------------------------------------------------------
 # -------------------------------------------------------------------
@@ -29,13 +47,18 @@ class Slider(object):
         **kwargs: Unused.
     """
 
-    _Frame     = None # Used to store the Tk.Frame object
-    _Scale     = None # Used to store the Tk.Scale object
-    _Label     = None # Used to store the Tk.Label object
-    _Entry     = None # Used to store the Tk.Entry object
-    _Value     = None # Used to store/trac the current value of the Slider
-    _name      = None # Name of the slider
-    _is_active = True # Bool, used to store the Slider state
+    __slots__ = ("_Frame",     # Used to store the Tk.Frame object
+                 "_Scale",     # Used to store the Tk.Scale object
+                 "_Label",     # Used to store the Tk.Label object
+                 "_Entry",     # Used to store the Tk.Entry object
+                 "_Text",      # Used to store the text shown in the Tk.Entry object
+                 "_Value",     # Used to store/trac the current value of the Slider
+                 "_name",      # Name of the slider
+                 "_is_active") # Bool, used to store the Slider state
+
+    # Validation commands registered on the master, shared by all
+    # sliders of the same type and range (see __init__).
+    _vcmd_cache = WeakKeyDictionary()
 
     FGACTIVE     = "#b0b0b0"
     BGACTIVE     = "#b0b0b0"
@@ -57,7 +80,8 @@ class Slider(object):
         else:
             raise Exception(f"unexpected input on argument `type_` when initializing {self.__class__.__name__}")
 
-        self._name = name
+        self._name      = name
+        self._is_active = True
 
         # Frame around the slider objects
         self._Frame = Frame(master)
@@ -75,39 +99,51 @@ class Slider(object):
         self._Label.place(x = 0)
 
         # Adding text element
-        self._Entry = Entry(self._Frame, bd = 0, width = 4)
-        self._Entry.insert(INSERT, 0)
+        self._Text  = StringVar(master, value = "0")
+        self._Entry = Entry(self._Frame, bd = 0, width = 4, textvariable = self._Text)
 
         # Register a function which checks if the user input is valid or not.
-        vcmd = self._Entry.register(vcmd)
+        # Registered once per master, type, and range; the range is kept
+        # numeric on the Python side instead of being passed through Tcl.
+        vcmds = self._vcmd_cache.setdefault(master, {})
+        key   = (type_, from_, to)
+        if key not in vcmds:
+            vcmds[key] = master.register(lambda x: vcmd(x, from_, to))
         self._Entry.config(justify = RIGHT, validate = "key",
-                           validatecommand = (vcmd, "%P", from_, to))
+                           validatecommand = (vcmds[key], "%P"))
         self._Entry.place(x = width - 40)
 
         # Changing the Tk.Value triggers the GUI update
-        def fun(event, parent):
-            val = event.widget.get()
-            # Empty? Use existing value
-            if len(val) == 0:
-                event.widget.insert(0, self._Value.get())
-            # Else change value
-            else:
-                # Just to double-check: must be a number
-                try:
-                    val = float(val)
-                    self._Value.set(event.widget.get())
-                # This exception should never happen!
-                except:
-                    pass
-        self._Entry.bind("<Return>",   lambda event: fun(event, self))
-        self._Entry.bind("<FocusOut>", lambda event: fun(event, self))
+        self._Entry.bind("<Return>",   self._on_entry_commit)
+        self._Entry.bind("<FocusOut>", self._on_entry_commit)
 
         # Tracing the _Value
-        self._Value.trace(mode = "w", callback = self.OnTrace)
+        self._Value.trace_add("write", self.OnTrace)
 
         # Disable if necessary
         if not active: self.disable()
 
+    def _on_entry_commit(self, event):
+        """Entry Commit Action
+
+        Triggered when the user hits return or leaves the `Tk.Entry`
+        element. Sets the value of the slider to the current input
+        (or restores the current value if the input is empty).
+        """
+        val = event.widget.get()
+        # Empty? Use existing value
+        if len(val) == 0:
+            event.widget.insert(0, self._Value.get())
+        # Else change value
+        else:
+            # Just to double-check: must be a number
+            try:
+                val = float(val)
+                self._Value.set(event.widget.get())
+            # This exception should never happen!
+            except:
+                pass
+
     def isValidInt(self, x, from_ = -999, to = 999):
         """Check for Valid Integer
 
@@ -123,18 +159,16 @@ class Slider(object):
             bool: Returns `True` if `x` is a valid float within
             `[from_, to]` and `False` otherwise.
         """
-        # If empty
-        if len(x) == 0: return True
-        import re
-        # If not matching signed int: return False
-        if not re.match("^-?(0|[1-9]|[1-9][0-9]{1,2})?$", x): return False
-        # Only a "-": that's OK
-        if re.match("^-$", x): return True
-        # Outside range? Return False
-        if float(x) < float(from_) or float(x) > float(to):
+        # If empty or only a "-": that's OK
+        if len(x) == 0 or x == "-": return True
+        # If not a signed int with up to three digits (no leading
+        # zeros): return False
+        digits = x[1:] if x[0] == "-" else x
+        if not (digits.isascii() and digits.isdigit()): return False
+        if len(digits) > 3 or (len(digits) > 1 and digits[0] == "0"):
             return False
-        # Else True
-        return True
+        # Outside range? Return False
+        return int(from_) <= int(x) <= int(to)
 
     def isValidFloat(self, x, from_ = -999., to = 999.):
         """Check for Valid Float
@@ -161,11 +195,8 @@ class Slider(object):
         except Exception as e:
             return False
         # If more than one digits:
-        import re
-        if from_ >= 0:
-            if not re.match("[0-9]+(\\.|\\.[0-9])?$", str(x)): return False
-        else:
-            if not re.match("-?[0-9]+(\\.|\\.[0-9])?$", str(x)): return False
+        pattern = _FLOAT_POS_RE if from_ >= 0 else _FLOAT_NEG_RE
+        if not pattern.match(str(x)): return False
         return True
 
     def OnTrace(self, *args, **kwargs):
@@ -175,7 +206,6 @@ class Slider(object):
         is loading the current value and sets the `Tk.Scale` and
         `Tk.Entry` element to the new value.
         """
-        val = self._Value.get()
         self.set(self._Value.get())
 
     def name(self):
@@ -191,11 +221,14 @@ class Slider(object):
     def set(self, val):
         # Ensure it is integer if slider only accepts integer
         if isinstance(self._Value, IntVar): val = int(val)
+        # Nothing to do if the value does not change; this also breaks
+        # the feedback loop via OnTrace when setting the Tk.Scale below.
+        if str(val) == self._Text.get() and float(val) == float(self._Scale.get()):
+            return
         # Setting slider
         self._Scale.set(val)
         # Setting Text
-        self._Entry.delete(0, END)
-        self._Entry.insert(0, val)
+        self._Text.set(val)
 
     def get(self):
         """Get Value
@@ -209,18 +242,21 @@ class Slider(object):
         return self._Value.get()
 
 
-    def trace(self, mode, *args, **kwargs):
+    def trace(self, mode, callback):
         """Trace Method
 
         Trace method of the :py:class:`Slider` object.
 
         Args:
-            mode (str): Default is `w` (call observer when variable is written).
-            args: Passed to `Tkinter.<vartype>.trace()`, at least
-                one argument (a callback function) should be provided.
-            **kwargs: Passed to `Tkinter.<vartype>.trace()`, unused.
+            mode (str, list): Typically `"write"` (call observer when variable
+                is written), see `tkinter.<vartype>.trace_add()`. The legacy
+                modes `"w"`, `"r"`, and `"u"` are still accepted.
+            callback (callable): Callback function, passed to
+                `tkinter.<vartype>.trace_add()`.
         """
-        self._Value.trace(mode, *args, **kwargs)
+        if isinstance(mode, str):
+            mode = {"w": "write", "r": "read", "u": "unset"}.get(mode, mode)
+        self._Value.trace_add(mode, callback)
 
     def disable(self):
         """Disable Slider
@@ -239,8 +275,7 @@ class Slider(object):
                 fg = self.DISABLED,
                 bg = self.BGDISABLED)
         self._is_active = False
-        self._Entry.delete(0, END)
-        self._Entry.insert(0, 0)
+        self._Text.set(0)
 
     def enable(self):
         """Enable Slider
@@ -274,6 +309,14 @@ class Slider(object):
 # -------------------------------------------------------------------
 # -------------------------------------------------------------------
 # -------------------------------------------------------------------
+@lru_cache(maxsize = 256)
+def _palette_colors(pal, n):
+    """Colors of a default palette, cached as the default palette panel
+    draws the same palettes over and over again (see
+    :py:class:`defaultpalettecanvas`)."""
+    return tuple(pal.colors(n))
+
+
 class defaultpalettecanvas(object):
     """Draw Default Palette Canvas
 
@@ -293,13 +336,15 @@ class defaultpalettecanvas(object):
         figheight (float): Width of the `Tk.Canvas` element (palframe input).
     """
 
+    __slots__ = ("_palframe", "_sliders", "_pal", "_image")
+
     def __init__(self, palframe, sliders, pal, n, xpos, figwidth, figheight):  
 
         self._palframe = palframe
         self._sliders  = sliders
         self._pal      = pal
 
-        colors = pal.colors(n)
+        colors = _palette_colors(pal, n)
         self._draw_canvas(colors, xpos, figwidth, figheight)
 
     def _draw_canvas(self, colors, xpos, figwidth, figheight):
@@ -309,22 +354,30 @@ class defaultpalettecanvas(object):
         n = len(colors)
         h = (figheight - 2. * offset) / len(colors)
         w = figwidth  - 2. * offset
+        height = int(figheight - 2. * offset)
 
         canvas = Canvas(self._palframe, width = figwidth,
                         height = figheight, bg = "#ffffff")
         canvas.place(x = xpos, y = 0)
         # Binding for interaction
-        canvas.bind("<Button-1>", lambda event: \
-                self._activate(event, self._pal, self._sliders))
+        canvas.bind("<Button-1>", self._on_click)
+
+        # Draw all colors into one PhotoImage with a single `put` call rather
+        # than creating one canvas rectangle per color. The data is a single
+        # pixel column (one row per pixel) which is tiled horizontally.
+        data = " ".join("{%s}" % colors[min(int(y / h), n - 1)] for y in range(height))
+        self._image = PhotoImage(master = canvas, width = int(w), height = height)
+        self._image.put(data, to = (0, 0, int(w), height))
+        canvas.create_image(offset, offset, anchor = NW, image = self._image)
 
-        for i in range(0, n):
-            canvas.create_rectangle(offset, i*h, w, (i+1)*h,
-                                    width = 0, fill = colors[i])
+    def _on_click(self, event):
+        self._activate(event, self._pal, self._sliders)
 
     def _activate(self, event, pal, sliders):
 
-        # Loading settings of the current palette
-        settings = pal.get_settings()
+        # Loading settings of the current palette (copy, lambda
+        # functions are evaluated below)
+        settings = dict(pal.get_settings())
 
         # For some palettes, elements can be lambda functions (mainly h1, h2).
         # Run over all settings and execute the function. For that, we need n
@@ -337,11 +390,12 @@ class defaultpalettecanvas(object):
 
         # Setting sliders
         for elem in sliders:
+            name = elem.name()
             # Setting value, enables the slider
-            if elem.name() == "n":
+            if name == "n":
                 continue
-            elif elem.name() in settings.keys():
-                elem.set(settings[elem.name()])
+            elif name in settings:
+                elem.set(settings[name])
                 elem.enable()
             # Disable slider
             else:
@@ -365,6 +419,8 @@ class currentpalettecanvas:
         height (float): Height of the palette on the interface.
     """
 
+    __slots__ = ("parent", "x", "y", "width", "height", "canvas", "image", "colors")
+
     def __init__(self, parent, x, y, width, height):
 
         self.parent = parent
@@ -377,23 +433,42 @@ class currentpalettecanvas:
         self.canvas.config(borderwidth = 1, bg = "#000000")
         self.canvas.place(x = self.x, y = self.y + 20)
 
-    def _draw_canvas(self, colors):
+        # The colors are drawn into a PhotoImage which is placed on the
+        # canvas once and updated on every redraw (see _draw_canvas).
+        self.image = PhotoImage(master = self.canvas,
+                                width = self.width, height = self.height + 1)
+        self.canvas.create_image(0, 0, anchor = NW, image = self.image)
+        self.colors = None # Colors currently drawn
 
-        from numpy import floor
+    def _draw_canvas(self, colors):
 
         n = len(colors)
-        w = floor(float(self.width) / float(len(colors)))
-        h = self.height
-        # Overwrite everything with a white box
-        self.canvas.create_rectangle(0, 0, self.width, self.height + 1, width = 0, fill = "white")
-        for i in range(0, n):
-            if colors[i] is None: continue
-            # Dropping Nan's
-            if len(str(colors[i])) < 7: continue
-            # Last box to self.width
-            x1 = (i+1) * w if i < (n-1) else self.width
-            self.canvas.create_rectangle(i*w, 0, x1, h+1,
-                    width = 0, fill = colors[i])
+        if n == 0: return
+        w = self.width // n
+
+        # White for missing colors (None, NaN)
+        colors = [c if c is not None and len(str(c)) >= 7 else "#ffffff" for c in colors]
+
+        # Same number of colors as drawn last time: only update the boxes
+        # whose color changed (one `put` per box; the color is tiled).
+        # The last box is extended to self.width.
+        if self.colors is not None and len(self.colors) == n:
+            for i in range(0, n):
+                if colors[i] == self.colors[i]: continue
+                x1 = (i+1) * w if i < (n-1) else self.width
+                self.image.put(colors[i], to = (i*w, 0, x1, self.height + 1))
+
+        # Else draw all colors; set up one row of pixels and draw it
+        # with a single `put` call, the row is tiled vertically.
+        else:
+            row = []
+            for i in range(0, n):
+                x1   = (i+1) * w if i < (n-1) else self.width
+                row += [colors[i]] * (x1 - i*w)
+            self.image.put("{" + " ".join(row) + "}",
+                           to = (0, 0, self.width, self.height + 1))
+
+        self.colors = colors
 
 
 
@@ -425,18 +500,7 @@ def choose_palette(**kwargs):
     obj = gui(**kwargs)
     obj.mainloop()
 
-    from . import palettes
-    method = getattr(palettes, obj.method())
-
-    # Overwrite __init__ method, add new defaults
-    import sys
-    if sys.version_info.major < 3:
-        varnames = list(method.__init__.im_func.func_code.co_varnames)
-        defaults = list(method.__init__.im_func.func_defaults)
-    else:
-        varnames = list(method.__init__.__code__.co_varnames)
-        defaults = list(method.__init__.__defaults__)
-
+    method = _PALETTE_FUNS[obj.method()]
 
     # Getting current parameters from slider object
     settings = {}
@@ -447,33 +511,20 @@ def choose_palette(**kwargs):
         settings[s.name()] = s.get()
 
     # Prepare new default arguments
-    for key in ["h","c","l","p"]:
-        k1  = f"{key}1"
-        k2  = f"{key}2"
+    for key in ("h", "c", "l", "p"):
+        v1  = settings.pop(f"{key}1", None)
+        v2  = settings.pop(f"{key}2", None)
         key = "power" if key == "p" else key
-        if k1 in settings.keys() and k2 in settings.keys():
-            settings[key] = [settings[k1], settings[k2]]
-            del settings[k1]
-            del settings[k2]
-        elif k1 in settings.keys():
-            settings[key] = settings[k1]
-            del settings[k1]
-        elif k2 in settings.keys():
-            settings[key] = settings[k2]
-            del settings[k2]
-
-    for idx,key in enumerate(varnames[1:(len(defaults)+1)]):
-        if key in settings.keys():
-            defaults[idx] = settings[key]
-
-    import types
-    method.__init__ = types.FunctionType(method.__init__.__code__,
-                                         method.__init__.__globals__,
-                                         method.__init__.__name__,
-                                         tuple(defaults),
-                                         method.__init__.__closure__)
-
-    return method()
+        if v1 is not None and v2 is not None: settings[key] = [v1, v2]
+        elif v1 is not None:                  settings[key] = v1
+        elif v2 is not None:                  settings[key] = v2
+
+    # Only forward settings which are named arguments of the palette
+    # constructor; all others keep their defaults.
+    params = [k for k, p in signature(method).parameters.items() \
+              if p.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)]
+
+    return method(**{k: v for k, v in settings.items() if k in params})
 
 
 # -------------------------------------------------------------------
@@ -498,6 +549,7 @@ class gui(Tk):
     HEIGHT = 700
     FRAMEHEIGHT = 100
     FRAMEWIDTH  = WIDTH - 20
+    COLORS_CACHE_SIZE = 64
 
     # Slider settings
     _slider_settings = {
@@ -526,12 +578,29 @@ class gui(Tk):
     # Tkiter object for the demo
     _demoTk         = None
 
+    # Whether or not matplotlib is available for the demo (None: not yet checked)
+    _hasmatplotlib  = None
+
     # Used to store the control buttons (desaturate, reversed, ...)
     _control        = None
 
+    # Current control options, None if not yet read (see control())
+    _control_cache  = None
+
+    # Control options used as long as the control buttons are not yet set up
+    _default_control = {"reverse" : False, "desaturate" : False, "cvd" : False,
+                        "cvdtype" : "deutan", "fixup": True}
+
     # Used with the .after method to 'lock' updating/calling certain tkinter functions
     _locked         = False
 
+    # Redraw scheduled by OnChange (id returned by .after) and delay in milliseconds
+    _pending_redraw = None
+    REDRAW_DELAY    = 30
+
+    # Settings at the last redraw (see _redraw)
+    _last_redraw_key = None
+
     # Initialize defaults
     _setting_names = ["h1", "h2", "c1", "cmax", "c2", "l1", "l2", "p1", "p2", "n"]
     _settings       = {}
@@ -544,13 +613,17 @@ class gui(Tk):
         # Initialization arguments, if any
         init_args = {}
         # Default if no inputs are set
-        if not "palette" in kwargs.keys():  palette = "Blue-Red"
+        if not "palette" in kwargs:         palette = "Blue-Red"
         else:                               palette = kwargs["palette"]
 
         # Find initial values
-        from . import hclpalettes
-        self._palettes = hclpalettes()
-        pal            = self._palettes.get_palette(palette)
+        self._palettes    = palettes.hclpalettes()
+        self._paltypes    = self._palettes.get_palette_types()
+        self._pal_by_type = {}
+        self._palframe_by_type = {}
+        self._colors_cache = OrderedDict()
+        self._method_cache = {}
+        pal               = self._palettes.get_palette(palette)
 
         # Store palette name and palette type to select
         # the correct drop down entries
@@ -600,10 +673,9 @@ class gui(Tk):
         """
 
         # Removing DivergingX class of HCL palettes; not included in choose_palette
-        from re import match
         opts = []
-        for o in self.palettes().get_palette_types():
-            if not match(r".*DivergingX", o): opts.append(o)
+        for o in self._paltypes:
+            if not re.match(r".*DivergingX", o): opts.append(o)
 
         paltypevar = StringVar(self)
         paltypevar.set(type_) # default value
@@ -623,24 +695,19 @@ class gui(Tk):
         every time the drop down element changes.
         """
 
-        import time
-
         self._locked = True
 
         # Updating the palette-frame.
         self._palframe = self._add_palframe(args[0])
 
         # Take first palette
-        p = self.palettes().get_palettes(args[0], exact = True)[0]
+        p = self.get_palettes(args[0])[0]
 
         # Enable/disable/set sliders
-        settings = p.get_settings()
+        settings = dict(p.get_settings())
         
-        n = 7
-        for elem in self.sliders():
-            if elem.name() == "n":
-                n = elem.get()
-                break
+        sliders = self._sliders
+        n       = self._n_slider.get()
 
         # For some palettes, elements can be lambda functions (mainly h1, h2).
         # Run over all settings and execute the function.
@@ -652,12 +719,13 @@ class gui(Tk):
                     settings[k] = v(n, settings["h1"])
 
         # Setting up slider
-        for elem in self.sliders():
+        for elem in sliders:
+            name = elem.name()
             # Setting value, enables slider
-            if elem.name() == "n":
+            if name == "n":
                 continue
-            elif elem.name() in settings.keys():
-                elem.set(settings[elem.name()])
+            elif name in settings:
+                elem.set(settings[name])
                 elem.enable()
             # Disable slider
             else:
@@ -685,7 +753,7 @@ class gui(Tk):
         # Fixup colors
         fixupvar      = BooleanVar()
         fixupbutton   = Checkbutton(frame, text="Fixup colors",
-                                    variable = fixupvar, command = self.OnChange)
+                                    variable = fixupvar, command = self._on_control_change)
         fixupbutton.grid(column = col, row = row, sticky = "w"); row += 1
         fixupbutton.select()
         control["fixup"] = fixupvar
@@ -693,7 +761,7 @@ class gui(Tk):
         # Reverse colors
         revvar      = BooleanVar()
         revbutton   = Checkbutton(frame, text="Reverse colors",
-                                  variable = revvar, command = self.OnChange)
+                                  variable = revvar, command = self._on_control_change)
         revbutton.grid(column = col, row = row, sticky = "w"); row += 1
         control["reverse"] = revvar
 
@@ -702,24 +770,24 @@ class gui(Tk):
 
         desatvar    = BooleanVar()
         desatbutton = Checkbutton(frame, text="Desaturation",
-                                  command = self.OnChange, variable = desatvar)
+                                  command = self._on_control_change, variable = desatvar)
         desatbutton.grid(column = col, row = row, sticky = "w"); row += 1
         control["desaturate"] = desatvar
 
         cvdvar      = BooleanVar()
         cvdbutton   = Checkbutton(frame, text="Color blindness",
-                                  command = self.OnChange, variable = cvdvar)
+                                  command = self._on_control_change, variable = cvdvar)
         cvdbutton.grid(column = col, row = row, sticky = "w"); col += 1
         control["cvd"] = cvdvar
 
         # Radio buttons for CVD
         ypos = self.HEIGHT - 20
         cvdtypevar  = StringVar()
-        radio_deutan = Radiobutton(frame, text = "deutan", command = self.OnChange,
+        radio_deutan = Radiobutton(frame, text = "deutan", command = self._on_control_change,
                                    variable = cvdtypevar, value = "deutan")
-        radio_protan = Radiobutton(frame, text = "protan", command = self.OnChange,
+        radio_protan = Radiobutton(frame, text = "protan", command = self._on_control_change,
                                    variable = cvdtypevar, value = "protan")
-        radio_tritan = Radiobutton(frame, text = "tritan", command = self.OnChange,
+        radio_tritan = Radiobutton(frame, text = "tritan", command = self._on_control_change,
                                    variable = cvdtypevar, value = "tritan")
         radio_deutan.grid(column = col, row = row, sticky = "w"); col += 1
         radio_protan.grid(column = col, row = row, sticky = "w"); col += 1
@@ -738,17 +806,23 @@ class gui(Tk):
         """
 
 
-        if not self._control:
-            return {"reverse" : False, "desaturate" : False, "cvd" : False,
-                    "cvdtype" : "deutan", "fixup": True}
-        else:
-            res = {}
-            res["reverse"]    = self._control["reverse"].get()
-            res["desaturate"] = self._control["desaturate"].get()
-            res["cvd"]        = self._control["cvd"].get()
-            res["cvdtype"]    = self._control["cvdtype"].get()
-            res["fixup"]      = self._control["fixup"].get()
-            return res
+        c = self._control
+        if not c:
+            return dict(self._default_control)
+        # Read from the control elements if changed since last call
+        if self._control_cache is None:
+            self._control_cache = {k: c[k].get() for k in self._default_control}
+        return dict(self._control_cache)
+
+    def _on_control_change(self, *args, **kwargs):
+        """On Control Changed Action
+
+        Callback of the control elements (see :py:func:`_add_control`).
+        Resets the cached control options (see :py:func:`control`)
+        and calls :py:func:`OnChange`.
+        """
+        self._control_cache = None
+        self.OnChange()
 
 
     def settings(self, *args, **kwargs):
@@ -774,8 +848,8 @@ class gui(Tk):
                 # Loading setting
                 if key in self._setting_names:
                     res[key] = self._settings[key]
-            if len(res) == 1:   return res[list(res.keys())[0]]
-            else:               return reskk
+            if len(res) == 1:   return next(iter(res.values()))
+            else:               return res
         # Store values, if possible.
         else:
             for key,val in kwargs.items():
@@ -808,6 +882,24 @@ class gui(Tk):
         """
         return self._palettes
 
+    def get_palettes(self, type_):
+        """Get Palettes of a Specific Type
+
+        Returns the default palettes of type `type_` (exact match, see
+        :py:func:`palettes.hclpalettes.get_palettes`). The result is
+        cached such that switching between palette types does not
+        search the available palettes over and over again.
+
+        Args:
+            type_ (str): Name of the palette type.
+
+        Returns:
+            list: List of :py:class:`palettes.defaultpalette` objects.
+        """
+        if type_ not in self._pal_by_type:
+            self._pal_by_type[type_] = self.palettes().get_palettes(type_, exact = True)
+        return self._pal_by_type[type_]
+
     def sliders(self):
         """Get Sliders
 
@@ -833,26 +925,38 @@ class gui(Tk):
 
         Adds a `Tk.Frame` to the `Tk` element (see :py:func:`_init_master`).
         This frame is used to take up the default palettes.
+        The frames are set up once per palette type and kept; when
+        switching the palette type the current frame is hidden
+        and the one for `type_` (re-)placed.
         """
 
+        # Hide current frame (if any)
+        if self._palframe is not None: self._palframe.place_forget()
+
+        # Frame for this palette type already drawn? Show again.
+        if type_ in self._palframe_by_type:
+            frame = self._palframe_by_type[type_]
+            frame.place(x = 10, y = 80)
+            return frame
+
         frame = Frame(self, bg = "#ffffff",
                       height = self.FRAMEHEIGHT, width = self.FRAMEWIDTH)
         frame.place(x = 10, y = 80)
+        self._palframe_by_type[type_] = frame
 
         # Loading palettes of currently selected palette type
-        from numpy import min, sum
-        pals = self.palettes().get_palettes(type_, exact = True)
-        for child in frame.winfo_children(): child.destroy()
+        pals = self.get_palettes(type_)
 
-        # Number of palettes to be drawn (where gui = 1 in palette config)
-        npals    = sum([x.get("gui") for x in pals])
+        # Palettes to be drawn (where gui = 1 in palette config)
+        pals     = [x for x in pals if x.get("gui") > 0]
 
         # Adding new canvas
-        figwidth = min([30, self.FRAMEWIDTH / npals])
+        figwidth = min(30, self.FRAMEWIDTH / len(pals))
+        sliders  = self.sliders()
+        height   = self.FRAMEHEIGHT
         xpos = 0
         for pal in pals:
-            if pal.get("gui") <= 0: continue
-            defaultpalettecanvas(frame, self.sliders(), pal, 5, xpos, figwidth, self.FRAMEHEIGHT)
+            defaultpalettecanvas(frame, sliders, pal, 5, xpos, figwidth, height)
             xpos += figwidth
 
         return frame
@@ -879,108 +983,113 @@ class gui(Tk):
         if not self._locked:
             self._currentpalette._draw_canvas(self.get_colors())
 
-    def get_colors(self):
-        """Get Colors
+    def _get_params(self):
+        """Get Current Palette Parameters
+
+        Reads the current settings from the sliders and control elements.
 
         Returns:
-            list: Returns a list of hex colors and `nan` given the current
-            settings on the GUI. `numpy.nan` will be returned if `fixup` is
-            set to False but some colors lie outside the RGB color space.
+            tuple: Palette type (str), number of colors (int), the parameters
+            for the palette method (dict), the control options (dict, see
+            :py:func:`control`), and a hashable key identifying these settings
+            (tuple; used to cache the colors, see :py:func:`get_colors`).
         """
 
         # Getting current arguments
         params = {}
-        for elem in self.sliders():
+        for name, elem in self._slider_by_name.items():
             if elem.is_active():
-                params[elem.name()] = float(elem.get())
-
-        # Small helper function to check if e.g., "c1", "c2", "cmax"
-        # are parameters in the params dict. Scopes 'dim' (loop variable)
-        # and 'params' (the parameters for this palette).
-        def phas(x):
-            return f"{dim}{str(x)}" in params.keys()
-
-        # Similar to the 'phas' method but will return the 
-        # actual value. Will throw an error if it does not exist (that means
-        # you have not properly checked if has(x)!
-        def pget(x):
-            x = f"{dim}{str(x)}"
-            assert x in params.keys(), Exception(f"get(\"{str(x)}\"): None or not existing")
-            return params[x]
-
-        # Similar to the two functions above.
-        # Will delete an element from 'params', again scoping.
-        def pdel(x):
-            del params[f"{dim}{str(x)}"]
-
-        # Manipulate params
-        from re import match
-        for dim in ["h", "c", "l", "p"]:
-
-            # Generate "h1", "h2", "hmax" (if dim = h)
-            # to check if these are available parameters.
-            dim1 = f"{dim}1"
-            dim2 = f"{dim}2"
-            dim3 = f"{dim}max"
-            dim  = "power" if dim == "p" else dim
+                params[name] = float(elem.get())
+
+        # Current palette type
+        type_ = self._Dropdown.get()
+
+        # Manipulate params; combine "h1", "h2", "hmax" (if dim = h)
+        # into "h" and remove the individual parameters. The power
+        # parameters ("p1", "p2") are forwarded as they are.
+        for dim in ["h", "c", "l"]:
+            v1   = params.pop(f"{dim}1",   None)
+            v2   = params.pop(f"{dim}2",   None)
+            vmax = params.pop(f"{dim}max", None)
+            if v1 is None: continue
 
             # All three available? That must be c1, c2, cmax.
             # Get it in the order [c1, cmax, c2] as the hcl palette function requires it.
-            if phas(1) and phas(2) and phas("max"):
-                params[dim] = [pget(x) for x in ["1", "max", "2"]]
-
+            if v2 is not None and vmax is not None:
+                params[dim] = [v1, vmax, v2]
+            # If has 1 and max: [c1, cmax]
+            elif vmax is not None:
+                params[dim] = [v1, vmax]
             # If has 1 and 2: [c1, c2]
-            elif phas(1) and phas("max"):
-                # Diverging chemes: only [c1, cmax] allowed, for
-                # others [c1, cmax] (sequential)
-                if match(".*[Dd]iverging.*", self._Dropdown.get()) and dim == "c":
-                    params[dim] = [pget(x) for x in ["1", "max"]]
-                else:
-                    params[dim] = [pget(1), pget("max")]
-            # If has 1 and 2: [c1, c2]
-            elif phas(1) and phas(2):
-                params[dim] = [pget(x) for x in ["1", "2"]]
-
+            elif v2 is not None:
+                params[dim] = [v1, v2]
             # If has 1: [c1]
-            elif phas(1):
-                params[dim] = pget(1)
-
-            # Remove the individual parameters from 'params'
-            for x in ["1", "2", "max"]:
-                if phas(x): pdel(x)
+            else:
+                params[dim] = v1
 
         # Loading 'n' from slider
-        for elem in self.sliders():
-            if elem.name() == "n":
-                n = elem.get()
-                break
+        n = self._n_slider.get()
 
         # Check if we have to return the colors reversed.
         # and whether or not fixup is set to True/False
         control = self.control()
-        if not "h" in params.keys(): sys.exit("whoops, lost h")
-        if "n" in params: del params["n"]
+        assert "h" in params, "internal error; hue parameter missing"
+        params.pop("n", None)
         params["fixup"] = control["fixup"]
 
-        # Draw colors from current color map
-        from . import palettes
-        type_    = self._Dropdown.get()
-        colorfun = self.palettes().get_palettes(type_, exact = True)[0].method()
-        fun      = getattr(palettes, colorfun)
+        # Key identifying the current settings; parameters and
+        # control options plus palette type and n.
+        key = (type_, n, tuple(control.items()),
+               tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()))
+
+        return type_, n, params, control, key
+
+    def get_colors(self):
+        """Get Colors
+
+        Returns:
+            list: Returns a list of hex colors and `nan` given the current
+            settings on the GUI. `numpy.nan` will be returned if `fixup` is
+            set to False but some colors lie outside the RGB color space.
+        """
+
+        type_, n, params, control, key = self._get_params()
+
+        # Nothing to draw
+        if n <= 0: return []
+
+        # Colors already computed for these settings?
+        if key in self._colors_cache:
+            self._colors_cache.move_to_end(key)
+            return list(self._colors_cache[key])
+
+        colorfun, fun = self._get_method(type_)
 
         # Return colors
         colors = fun(**params)(n, rev = control["reverse"])
 
-        # Do we have to desaturate the colors?
-        if control["desaturate"]:
-            from .CVD import desaturate
-            colors = desaturate(colors)
+        # Desaturation and/or CVD simulation. Converting the colors into
+        # a color object once such that both steps work on the same
+        # coordinates; only converted back to hex colors at the end.
+        if control["desaturate"] or control["cvd"]:
+            cols = hexcols(colors)
+            cols.to("sRGB")
+
+            # Do we have to desaturate the colors?
+            if control["desaturate"]:
+                cols = CVD.desaturate(cols)
 
-        # Do we have to apply CVD simulation?
-        if control["cvd"]:
-            from . import CVD
-            fun = getattr(CVD, control["cvdtype"])
-            colors = fun(colors)
+            # Do we have to apply CVD simulation?
+            if control["cvd"]:
+                fun  = _CVD_FUNS[control["cvdtype"]]
+                cols = fun(cols)
+
+            colors = cols.colors()
+
+        # Keep the last COLORS_CACHE_SIZE results
+        self._colors_cache[key] = tuple(colors)
+        if len(self._colors_cache) > self.COLORS_CACHE_SIZE:
+            self._colors_cache.popitem(last = False)
 
         return colors
 
@@ -995,9 +1104,23 @@ class gui(Tk):
             :py:class:`palettes.qualitative_hcl`, and for "Sequential" palettes
             :py:class:`palettes.sequential_hcl`.
         """
-        type_    = self._Dropdown.get()
-        colorfun = self.palettes().get_palettes(type_, exact = True)[0].method()
-        return colorfun
+        return self._get_method(self._Dropdown.get())[0]
+
+    def _get_method(self, type_):
+        """Get Palette Class/Method for Palette Type
+
+        Args:
+            type_ (str): Name of the palette type.
+
+        Returns:
+            tuple: Name of the object which has to be called to get the
+            colors (see :py:func:`method`) and the object itself. Cached
+            by palette type.
+        """
+        if type_ not in self._method_cache:
+            colorfun = self.get_palettes(type_)[0].method()
+            self._method_cache[type_] = (colorfun, _PALETTE_FUNS[colorfun])
+        return self._method_cache[type_]
 
 
     def _add_sliders(self):
@@ -1012,8 +1135,8 @@ class gui(Tk):
         sliders = []
 
         # For each key in self._setting_names add a Slider object
-        # (a Slider is a combined Tkinter.Scale, Tkinter.Entry, and
-        # Tkinter.Label element with bindings).
+        # (a Slider is a combined tkinter.Scale, tkinter.Entry, and
+        # tkinter.Label element with bindings).
         for idx,key in enumerate(self._setting_names):
             # Initialize with default 0 if nothing yet specified.
             s = Slider(self,
@@ -1033,7 +1156,11 @@ class gui(Tk):
 
         # Add the trace element to make them interactive
         # (an observer, call OnChange whenever the Scale changes).
-        for x in sliders: x.trace("w", self.OnChange)
+        for x in sliders: x.trace("write", self.OnChange)
+
+        # Keep sliders by name for direct access
+        self._slider_by_name = {x.name(): x for x in sliders}
+        self._n_slider       = self._slider_by_name["n"]
 
         return sliders
 
@@ -1042,8 +1169,27 @@ class gui(Tk):
         """On Slider Changed Action
 
         Triggered any time the slider values or control arguments change.
-        Draws new current palette (see :py:func:`_draw_currentpalette`).
+        Schedules a redraw of the current palette (see :py:func:`_redraw`)
+        in `REDRAW_DELAY` milliseconds if not already scheduled, such that
+        dragging a slider does not trigger a redraw on every single step.
+        """
+        if self._pending_redraw is None:
+            self._pending_redraw = self.after(self.REDRAW_DELAY, self._redraw)
+
+    def _redraw(self):
+        """Redraw Current Palette
+
+        Draws new current palette (see :py:func:`_draw_currentpalette`)
+        and updates the demo plot if open. Scheduled by :py:func:`OnChange`.
         """
+        self._pending_redraw = None
+
+        # Nothing changed since the last redraw (e.g., variable written
+        # with the same value)? Skip.
+        key = (self._get_params()[-1], self._DEMO.get())
+        if key == self._last_redraw_key: return
+        self._last_redraw_key = key
+
         self._draw_currentpalette()
 
         # Is the demo running?
@@ -1109,42 +1255,10 @@ class gui(Tk):
 
         Requires matplotlib to be installed.
         """
-        try:
-            import matplotlib
-            matplotlib.use("TkAgg")
-            hasmatplotlib = True
-        except:
-            hasmatplotlib = False
-
         # If has matplotlib: plot
-        if hasmatplotlib:
-
-            def draw_figure(canvas, figure, loc=(0, 0)):
-                """Draw a matplotlib figure onto a Tk canvas
-
-                loc (list of int): location of top-left corner of figure on canvas in pixels.
-
-                Inspired by matplotlib source: lib/matplotlib/backends/backend_tkagg.py
-                """
-                figure_canvas_agg = FigureCanvasAgg(figure)
-                figure_canvas_agg.draw()
-                figure_x, figure_y, figure_w, figure_h = figure.bbox.bounds
-                figure_w, figure_h = int(figure_w), int(figure_h)
-                photo = PhotoImage(master=canvas, width=figure_w, height=figure_h)
-
-                # Position: convert from top-left anchor to center anchor
-                canvas.create_image(loc[0] + figure_w/2, loc[1] + figure_h/2, image=photo)
-
-                # Unfortunately, there's no accessor for the pointer to the native renderer
-                tkagg.blit(photo, figure_canvas_agg.get_renderer()._renderer, colormode=2)
-
-                # Return a handle which contains a reference to the photo object
-                # which must be kept live or else the picture disappears
-                return photo
-
+        if self._ensure_matplotlib():
 
             # Getting demo plotting function
-            from . import demos
             fun = getattr(demos, self._DEMO.get())
 
             # Initialize (or update) the app
@@ -1168,6 +1282,24 @@ class gui(Tk):
             txt.pack()
             txt.insert(END, "\n".join(info))
 
+    def _ensure_matplotlib(self):
+        """Set up matplotlib for the Demo Plots
+
+        Imports matplotlib and sets the TkAgg backend on first use;
+        the result is stored such that this is only done once.
+
+        Returns:
+            bool: `True` if matplotlib is available, else `False`.
+        """
+        if gui._hasmatplotlib is None:
+            try:
+                import matplotlib
+                matplotlib.use("TkAgg")
+                gui._hasmatplotlib = True
+            except:
+                gui._hasmatplotlib = False
+        return gui._hasmatplotlib
+
     def _close_demo(self, *args, **kwargs):
         if not self._demoTk is None: self._demoTk.destroy()
         self._demoTk = None
@@ -1176,12 +1308,12 @@ class gui(Tk):
 # Tcl/Tk helper class for demo plots
 class DemoApp(Frame):
     def __init__(self, master, fun, colors):
-        from tkinter import Frame
         from matplotlib import pyplot as plt
         from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
         Frame.__init__(self, master)
         self.fig    = plt.figure(figsize = (8, 8), clear = True)
+        self.ax     = None
         self.master = master
 
         self.canvas = FigureCanvasTkAgg(self.fig, master = self.master)
@@ -1193,9 +1325,15 @@ class DemoApp(Frame):
         if not callable(fun):
             raise TypeError("argument `fun` must be a callable function")
 
-        # Clearing figure, adding axis and call plotting function
-        self.fig.clear(True)
-        ax     = self.fig.add_axes([0.025, 0.025, 0.95, 0.95])
-        fun(colors, ax = ax, fig = self.fig)
-        self.canvas.draw()
+        # Clearing the axis if it is the only one on the figure, else
+        # (first call, or demos adding their own axes) clear the figure
+        # and add a new axis. Then call plotting function
+        if self.fig.axes == [self.ax]:
+            self.ax.cla()
+        else:
+            self.fig.clear(True)
+            self.ax = self.fig.add_axes([0.025, 0.025, 0.95, 0.95])
+        fun(colors, ax = self.ax, fig = self.fig)
+        # Request redraw, rendered once Tk is idle
+        self.canvas.draw_idle()
 
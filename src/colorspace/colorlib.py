@@ -31,9 +31,16 @@
 # """
 
 
+import re
 import sys
 import numpy as np
-import inspect
+from copy import copy, deepcopy
+from functools import lru_cache
+from types import MappingProxyType
+
+# Pattern used by colorlib.hex_to_sRGB to validate hex colors;
+# compiled once on import.
+_HEX_RE = re.compile("^#[0-9A-Fa-f]{6}([0-9]{2})?$")
 
 class colorlib:
     """Color Handling Superclass
@@ -59,6 +66,13 @@ class colorlib:
     """Static constant; required for coordinate transformations.
     Often approximated as 7.787."""
 
+    _KAPPA116 = _KAPPA / 116.0
+    """Static constant; slope of the linear segment of the CIELAB
+    transfer function (`_KAPPA / 116`)."""
+
+    _INV_KAPPA116 = 116.0 / _KAPPA
+    """Static constant; reciprocal of `_KAPPA116`."""
+
     # Default white spot
     XN = np.asarray([ 95.047])
     """X value for default white spot. Used for coordinate transformations."""
@@ -67,6 +81,34 @@ class colorlib:
     ZN = np.asarray([108.883])
     """Z value for default white spot. Used for coordinate transformations."""
 
+    # Linear transformation between RGB and CIEXYZ (scaled by white)
+    _RGB2XYZ = np.asarray([[0.412453, 0.357580, 0.180423],
+                           [0.212671, 0.715160, 0.072169],
+                           [0.019334, 0.119193, 0.950227]])
+    """Static constant; matrix used to convert RGB to CIEXYZ."""
+
+    _XYZ2RGB = np.asarray([[ 3.240479, -1.537150, -0.498535],
+                           [-0.969256,  1.875992,  0.041556],
+                           [ 0.055648, -0.204043,  1.057311]])
+    """Static constant; matrix used to convert CIEXYZ to RGB."""
+
+    # Order of [v, n, m] giving [r, g, b] for the six HSV sextants
+    _HSV_SEXTANTS = np.asarray([[0, 1, 2], [1, 0, 2], [2, 0, 1],
+                                [2, 1, 0], [1, 2, 0], [0, 2, 1]], dtype = np.intp)
+    """Static constant; permutation table used by `HSV_to_sRGB`."""
+
+    # Lookup tables for 8-bit gamma correction, see _gamma_lut_
+    _GAMMA_LUT = {}
+
+    # Scalar white points as read-only arrays of length one, see _get_white_
+    _WHITE_CACHE = {}
+
+    # u and v of scalar white points, see _get_white_uv_
+    _WHITE_UV_CACHE = {}
+
+    # Two-digit hex codes for 0 to 255, used by sRGB_to_hex
+    _HEX_PAIRS = np.asarray([f"{i:02X}" for i in range(256)])
+
     # Conversion function
     def _DEG2RAD(self, x):
         """Convert degrees into radiant
@@ -103,11 +145,11 @@ class colorlib:
         white color) has to be specified. This function checks and prepares the
         `XN`, `YN`, and `ZN` definition. Defaults are used if the user does not specify a
         custom white point. If set, `XN`, `YN`, and `ZN` have to be of type `numpy.ndarray`,
-        either of length one (will be expanded to length "n"), or of length `n`.
+        either of length one (broadcasted by numpy), or of length `n`.
 
         Args:
             __fname__ (str): Name of the parent method, only used if errors are dropped.
-            n (int): Number of colors to which `NX`, `NY`, and `NZ` will be expanded.
+            n (int): Number of colors.
             XN (None, float, numpy.ndarray): Either `None` (default) or an
                 `nd.array` of length one or length `n`. White point specification for
                 dimension `X`, defaults to `None`.
@@ -117,37 +159,87 @@ class colorlib:
                 dimension `Z`, defaults to `None`.
 
         Raises:
-            TypeError: If `XN`, `YN` and `ZN` are invalid (not `None` nor in a format
-                that can be converted into a `numpy.ndarray`).
-            ValueError: If the resulting values `XN`, `YN`, and `ZN` are not all
-                of the same length.
+            ValueError: If `XN`, `YN` and `ZN` are invalid (not `None` nor in a format
+                that can be converted into a `numpy.ndarray`), or if the resulting
+                values `XN`, `YN`, and `ZN` are not all of the same length.
 
         Returns:
             list: Returns a list `[XN, YN, ZN]` with three `numpy.ndarrays`
-            of length `n`. If the inputs `XN`, `YN`, `ZN` (or some) were `None`,
+            of length `n`, or of length one if all three are of length one.
+            If the inputs `XN`, `YN`, `ZN` (or some) were `None`,
             the class defaults are used.
         """
 
+        # Scalar white point (or defaults); arrays of length one are
+        # broadcasted by numpy and can be reused across calls.
+        if all(x is None or isinstance(x, float) for x in (XN, YN, ZN)):
+            key = (XN, YN, ZN)
+            if key not in self._WHITE_CACHE:
+                if len(self._WHITE_CACHE) >= 32: self._WHITE_CACHE.clear()
+                res = []
+                for x, d in zip(key, (self.XN, self.YN, self.ZN)):
+                    if x is not None:
+                        d = np.asarray([x])
+                        d.flags.writeable = False
+                    res.append(d)
+                self._WHITE_CACHE[key] = res
+            return list(self._WHITE_CACHE[key])
+
         # Take defaults if not further specified
-        if not XN: XN = self.XN
-        if not YN: YN = self.YN
-        if not ZN: ZN = self.ZN
+        if XN is None: XN = self.XN
+        if YN is None: YN = self.YN
+        if ZN is None: ZN = self.ZN
 
         if isinstance(XN, float): XN = np.asarray([XN])
         if isinstance(YN, float): YN = np.asarray([YN])
         if isinstance(ZN, float): ZN = np.asarray([ZN])
 
-        # Expand if required
-        if len(XN) == 1 and not len(XN) == n: XN = np.repeat(XN, n)
-        if len(YN) == 1 and not len(YN) == n: YN = np.repeat(YN, n)
-        if len(ZN) == 1 and not len(ZN) == n: ZN = np.repeat(ZN, n)
+        # Convert to numpy.ndarray if needed
+        if not all(isinstance(x, np.ndarray) for x in (XN, YN, ZN)):
+            try:
+                [XN, YN, ZN] = [np.atleast_1d(np.asarray(x, dtype = float)) for x in (XN, YN, ZN)]
+            except Exception as e:
+                raise ValueError(f"arguments XN/YN/ZN to `{__fname__}` could not have been " + \
+                                 "converted to numpy.ndarray")
+
+        # Keep length one (broadcasting) unless lengths are mixed
+        if not (len(XN) == 1 and len(YN) == 1 and len(ZN) == 1):
+            if len(XN) == 1 and not len(XN) == n: XN = np.repeat(XN, n)
+            if len(YN) == 1 and not len(YN) == n: YN = np.repeat(YN, n)
+            if len(ZN) == 1 and not len(ZN) == n: ZN = np.repeat(ZN, n)
 
         # Check if all lengths match
-        if not np.all([len(x) == n for x in [XN, YN, ZN]]):
-            raise ValueError(f"arguments XN/YN/ZN to `{__fname__} have to be of the same length")
+        if not all(len(x) == n or len(x) == 1 for x in (XN, YN, ZN)):
+            raise ValueError(f"arguments XN/YN/ZN to `{__fname__}` have to be of the same length")
 
         return [XN, YN, ZN]
 
+    def _get_white_uv_(self, white, XN, YN, ZN):
+        """Get u and v of the White Point
+
+        Used by the CIELUV conversions. For scalar (or default) white points
+        the result only depends on the white point and is cached.
+
+        Args:
+            white (tuple): White point (`XN`, `YN`, `ZN`) as specified by the
+                user, used as key for the cache if all are `None` or float.
+            XN (numpy.ndarray): White point as returned by `_get_white_`.
+            YN (numpy.ndarray): See `XN`.
+            ZN (numpy.ndarray): See `XN`.
+
+        Returns:
+            list: Returns a list `[uN, vN]` of `numpy.ndarray`s, see `XYZ_to_uv`.
+        """
+        if not all(x is None or isinstance(x, float) for x in white):
+            return self.XYZ_to_uv(XN, YN, ZN)
+
+        if white not in self._WHITE_UV_CACHE:
+            if len(self._WHITE_UV_CACHE) >= 32: self._WHITE_UV_CACHE.clear()
+            res = self.XYZ_to_uv(XN, YN, ZN)
+            for x in res: x.flags.writeable = False
+            self._WHITE_UV_CACHE[white] = res
+        return self._WHITE_UV_CACHE[white]
+
 
     def _check_input_arrays_(self, __fname__, **kwargs):
         """Check Input Arrays
@@ -164,27 +256,27 @@ class colorlib:
             bool: Returns `True` if everything is OK, else an exception will be thrown.
         """
 
-        # Message will be dropped if problems occur
-        msg = "Problem while checking inputs \"{:s}\" to method \"{:s}\":".format(
-                ", ".join(kwargs.keys()), __fname__)
-
-        from numpy import asarray
         lengths = []
         for key,val in kwargs.items():
 
-            try:
-                val = asarray(val)
-            except Exception as e:
-                raise ValueError(f"argument `{key}` to {self.__class__.__name__} " + \
-                                  "could not have been converted to numpy.ndarray")
+            # Only non-arrays have to be converted for checking
+            if not isinstance(val, np.ndarray):
+                try:
+                    val = np.asarray(val)
+                except Exception as e:
+                    raise ValueError(f"argument `{key}` to {self.__class__.__name__} " + \
+                                      "could not have been converted to numpy.ndarray")
             # Else append length and proceed
             lengths.append(len(val))
 
         # Check if all do have the same length
-        if not np.all([x == lengths[0] for x in lengths]):
+        if any(x != lengths[0] for x in lengths):
+            # Message will be dropped
+            msg = "Problem while checking inputs \"{:s}\" to method \"{:s}\":".format(
+                    ", ".join(kwargs.keys()), __fname__)
             tmp = []
             for k,v in kwargs.items(): tmp.append(f"{k} = {v}")
-            msg = f" Arguments of different lengths: {', '.join(tmp)}."
+            msg += f" Arguments of different lengths: {', '.join(tmp)}."
             raise ValueError(msg)
 
         # If all is fine, simply return True
@@ -211,7 +303,7 @@ class colorlib:
     #
     #  gtrans maps linearized sRGB to sRGB.
     #  ftrans provides the inverse map.
-    def gtrans(self, u, gamma):
+    def gtrans(self, u, gamma, _check = True):
         """Gamma Correction
 
         Function `gtrans` and `ftrans` provide gamma correction which
@@ -223,32 +315,38 @@ class colorlib:
         `gtrans` maps linearised sRGB to sRGB, `ftrans` provides the inverse mapping.
 
         Args:
-            u (numpy.ndarray): Float array of length `N`.
+            u (numpy.ndarray): Float array of length `N`. If of dtype `uint8`,
+                `u` is interpreted as 8-bit intensities (`u / 255`) and the
+                result is looked up in a cached table of the 256 possible values.
             gamma (float, numpy.ndarray): gamma value; if float or
                 `numpy.ndarray` of length one, `gamma` will be recycled if needed.
+            _check (bool): Internal; if `False` the input checks are skipped,
+                used when the inputs have already been validated.
 
         Returns:
             numpy.ndarray: Gamma corrected values, same length as input `u`.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "gtrans"
 
-        # Input check
+        # Input check; gamma of length one is broadcasted
         if isinstance(gamma, float): gamma = np.asarray([gamma])
-        if len(gamma) == 1 and not len(gamma) == len(u):
-            gamma = np.repeat(gamma, len(u))
+        if _check and len(gamma) > 1:
+            self._check_input_arrays_(__fname__, u = u, gamma = gamma)
 
-        # Checking inputs
-        self._check_input_arrays_(__fname__, u = u, gamma = gamma)
+        # 8-bit input; take values from lookup table
+        if isinstance(u, np.ndarray) and u.dtype == np.uint8 and len(gamma) == 1:
+            return self._gamma_lut_("gtrans", float(gamma[0])).take(u)
 
-        # Transform
-        for i,val in np.ndenumerate(u):
-            if val > 0.00304: u[i] = 1.055 * np.power(val, (1. / gamma[i])) - 0.055
-            else:             u[i] = 12.92 * val
+        # Transform; power only evaluated where needed (u may be negative)
+        u   = np.asarray(u, dtype = float)
+        idx = u > 0.00304
+        res = 12.92 * u
+        res[idx] = 1.055 * np.power(u[idx], 1. / (gamma if len(gamma) == 1 else gamma[idx])) - 0.055
 
-        return u
+        return res
 
-    def ftrans(self, u, gamma):
+    def ftrans(self, u, gamma, _check = True):
         """Gamma Correction
 
         Function `gtrans` and `ftrans` provide gamma correction which
@@ -260,43 +358,63 @@ class colorlib:
         `gtrans` maps linearised sRGB to sRGB, `ftrans` provides the inverse mapping.
 
         Args:
-            u (numpy.ndarray): Float array of length `N`.
+            u (numpy.ndarray): Float array of length `N`. If of dtype `uint8`,
+                `u` is interpreted as 8-bit intensities (`u / 255`) and the
+                result is looked up in a cached table of the 256 possible values.
             gamma (float, numpy.ndarray): gamma value; if float or
                 `numpy.ndarray` of length one, `gamma` will be recycled if needed.
+            _check (bool): Internal; if `False` the input checks are skipped,
+                used when the inputs have already been validated.
 
         Returns:
             numpy.ndarray: Gamma corrected values, same length as input `u`.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "ftrans"
 
-        # Input check
+        # Input check; gamma of length one is broadcasted
         if isinstance(gamma, float): gamma = np.asarray([gamma])
-        if len(gamma) == 1 and not len(gamma) == len(u):
-            gamma = np.repeat(gamma, len(u))
+        if _check and len(gamma) > 1:
+            self._check_input_arrays_(__fname__, u = u, gamma = gamma)
 
-        # Checking inputs
-        self._check_input_arrays_(__fname__, u = u, gamma = gamma)
+        # 8-bit input; take values from lookup table
+        if isinstance(u, np.ndarray) and u.dtype == np.uint8 and len(gamma) == 1:
+            return self._gamma_lut_("ftrans", float(gamma[0])).take(u)
 
-        # Transform 
-        for i,val in np.ndenumerate(u):
-            if val > 0.03928: u[i] = np.power((val + 0.055) / 1.055, gamma[i])
-            else:             u[i] = val / 12.92
+        # Transform; power only evaluated where needed
+        u   = np.asarray(u, dtype = float)
+        idx = u > 0.03928
+        res = u / 12.92
+        res[idx] = np.power((u[idx] + 0.055) / 1.055, gamma if len(gamma) == 1 else gamma[idx])
 
-        return u
+        return res
+
+    def _gamma_lut_(self, fname, gamma):
+        """Lookup Table for 8-bit Gamma Correction
+
+        Args:
+            fname (str): Name of the gamma correction method, either
+                `"gtrans"` or `"ftrans"`.
+            gamma (float): gamma value.
+
+        Returns:
+            numpy.ndarray: Gamma corrected values for the 256 intensities
+            `0/255` to `255/255`; cached for subsequent calls.
+        """
+        key = (fname, gamma)
+        if key not in self._GAMMA_LUT:
+            self._GAMMA_LUT[key] = getattr(self, fname)(np.arange(256) / 255., np.asarray([gamma]))
+        return self._GAMMA_LUT[key]
 
     # Support function qtrans
     def _qtrans(self, q1, q2, hue):
-        if hue > 360.:   hue = hue - 360.
-        if hue < 0:      hue = hue + 360.
+        hue = np.mod(hue, 360.)
+        return np.select([hue < 60., hue < 180., hue < 240.],
+                         [q1 + (q2 - q1) * hue / 60., q2, q1 + (q2 - q1) * (240. - hue) / 60.],
+                         q1)
 
-        if hue < 60.:    return q1 + (q2 - q1) * hue / 60.
-        elif hue < 180.: return q2
-        elif hue < 240.: return q1 + (q2 - q1) * (240. - hue) / 60.
-        else:            return q1
 
-
-    def sRGB_to_RGB(self, R, G, B, gamma = 2.4):
+    def sRGB_to_RGB(self, R, G, B, gamma = 2.4, _check = True):
         """Convert Standard RGB to RGB
 
         Converting colors from the Standard RGB color space to RGB.
@@ -306,25 +424,30 @@ class colorlib:
             G (numpy.ndarray): Intensities for green (`[0., 1.]`).
             B (numpy.ndarray): Intensities for blue  (`[0., 1.]`).
             gamma (float): gamma adjustment, defaults to `2.4`.
+            _check (bool): Internal; if `False` the input checks are skipped,
+                used when the inputs have already been validated.
 
         Returns:
             list: Returns a list of `numpy.ndarray`s with `R`, `G`, and `B` values.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "sRGB_to_RGB"
 
-        # Input check
+        # Input check; gamma of length one is broadcasted
         if isinstance(gamma, float): gamma = np.asarray([gamma])
-        if len(gamma) == 1 and not len(gamma) == len(R):
-            gamma = np.repeat(gamma, len(R))
-
-        # Checking inputs
-        self._check_input_arrays_(__fname__, R = R, G = G, B = B, gamma = gamma)
+        if _check:
+            if len(gamma) == 1:
+                self._check_input_arrays_(__fname__, R = R, G = G, B = B)
+            else:
+                self._check_input_arrays_(__fname__, R = R, G = G, B = B, gamma = gamma)
+        if len(gamma) > 1: gamma = np.tile(gamma, 3)
 
-        # Apply gamma correction
-        return [self.ftrans(x, gamma) for x in [R, G, B]]
+        # Apply gamma correction on all three channels at once
+        n   = len(R)
+        res = self.ftrans(np.concatenate((R, G, B)), gamma, _check = False)
+        return [res[:n], res[n:(2 * n)], res[(2 * n):]]
 
-    def RGB_to_sRGB(self, R, G, B, gamma = 2.4):
+    def RGB_to_sRGB(self, R, G, B, gamma = 2.4, _check = True):
         """Convert RGB to Standard RGB
 
         Converts one (or multiple) colors defined by their red, blue, green,
@@ -336,23 +459,28 @@ class colorlib:
             G (numpy.ndarray): Intensities for green (`[0., 1.]`).
             B (numpy.ndarray): Intensities for blue  (`[0., 1.]`).
             gamma (float): gamma adjustment, defaults to `2.4`.
+            _check (bool): Internal; if `False` the input checks are skipped,
+                used when the inputs have already been validated.
 
         Returns:
             list: Returns a list of `numpy.ndarray`s with `R`, `G`, and `B` values.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "RGB_to_sRGB"
 
-        # Input check
+        # Input check; gamma of length one is broadcasted
         if isinstance(gamma, float): gamma = np.asarray([gamma])
-        if len(gamma) == 1 and not len(gamma) == len(R):
-            gamma = np.repeat(gamma, len(R))
-
-        # Checking inputs
-        self._check_input_arrays_(__fname__, R = R, G = G, B = B, gamma = gamma)
+        if _check:
+            if len(gamma) == 1:
+                self._check_input_arrays_(__fname__, R = R, G = G, B = B)
+            else:
+                self._check_input_arrays_(__fname__, R = R, G = G, B = B, gamma = gamma)
+        if len(gamma) > 1: gamma = np.tile(gamma, 3)
 
-        # Apply gamma correction
-        return [self.gtrans(x, gamma) for x in [R, G, B]]
+        # Apply gamma correction on all three channels at once
+        n   = len(R)
+        res = self.gtrans(np.concatenate((R, G, B)), gamma, _check = False)
+        return [res[:n], res[n:(2 * n)], res[(2 * n):]]
 
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
@@ -363,13 +491,15 @@ class colorlib:
     ## R, G, and B give the levels of red, green and blue as values
     ## in the interval [0., 1.].  X, Y and Z give the CIE chromaticies.
     ## XN, YN, ZN gives the chromaticity of the white point.
-    def RGB_to_XYZ(self, R, G, B, XN = None, YN = None, ZN = None):
+    def RGB_to_XYZ(self, R, G, B, XN = None, YN = None, ZN = None, _check = True):
         """Convert RGB to CIEXYZ
 
         `R`, `G`, and `B` give the levels of red, green and blue as values
         in the interval `[0., 1.]`.
         `XN`, `YN`, and `ZN` allow to specify additional CIE chromaticities to
-        specify a specific white point.
+        specify a specific white point. Only `YN` is used for scaling as the
+        conversion matrix already maps RGB white to the (D65) white point;
+        `XN` and `ZN` are accepted and validated for consistency.
 
         Args:
             R (numpy.ndarray): Intensities for red (`[0., 1.]`).
@@ -380,32 +510,37 @@ class colorlib:
                 When not specified (all `None`) a default white point is used.
             YN: See `XN`.
             ZN: See `XN`.
+            _check (bool): Internal; if `False` the input checks are skipped,
+                used when the inputs have already been validated.
 
         Returns:
             list: Returns corresponding coordinates of CIE chromaticities, a
             list of `numpy.ndarray`s of the same length as the inputs (`[X, Y, Z]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "RGB_to_XYZ"
         n = len(R) # Number of colors
 
         # Loading definition of white
         [XN, YN, ZN] = self._get_white_(__fname__, n, XN, YN, ZN)
 
         # Checking input
-        self._check_input_arrays_(__fname__, R = R, G = G, B = B)
+        if _check: self._check_input_arrays_(__fname__, R = R, G = G, B = B)
 
-        return [YN * (0.412453 * R + 0.357580 * G + 0.180423 * B),   # X
-                YN * (0.212671 * R + 0.715160 * G + 0.072169 * B),   # Y
-                YN * (0.019334 * R + 0.119193 * G + 0.950227 * B)]   # Z
+        # Single matrix product on the stacked (3, n) coordinates,
+        # scaled in place; only YN is used (see docstring)
+        res  = self._RGB2XYZ @ np.vstack((R, G, B))
+        res *= YN
+        return list(res)  # [X, Y, Z]
 
-    def XYZ_to_RGB(self, X, Y, Z, XN = None, YN = None, ZN = None):
+    def XYZ_to_RGB(self, X, Y, Z, XN = None, YN = None, ZN = None, _check = True):
         """Convert CIEXYZ to RGB
 
         `X`, `Y`, and `Z` specify the values in the three coordinates of the
         CIEXYZ color space,
         `XN`, `YN`, and `ZN` allow to specify additional CIE chromaticities to
-        specify a specific white point.
+        specify a specific white point. As in :py:method:`RGB_to_XYZ` only
+        `YN` is used for scaling; `XN` and `ZN` are validated only.
 
         Args:
             X (numpy.ndarray): Values for the `X` dimension.
@@ -416,25 +551,27 @@ class colorlib:
                 When not specified (all `None`) a default white point is used.
             YN: See `XN`.
             ZN: See `XN`.
+            _check (bool): Internal; if `False` the input checks are skipped,
+                used when the inputs have already been validated.
 
         Returns:
             list: Returns corresponding coordinates as a list of
             `numpy.ndarray`s of the same length as the inputs (`[R, G, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_RGB"
         n = len(X) # Number of colors
 
         # Loading definition of white
         [XN, YN, ZN] = self._get_white_(__fname__, n, XN, YN, ZN)
 
         # Checking input
-        self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
+        if _check: self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
 
-        # Only YN is used
-        return [( 3.240479 * X - 1.537150 * Y - 0.498535 * Z) / YN,   # R
-                (-0.969256 * X + 1.875992 * Y + 0.041556 * Z) / YN,   # G
-                ( 0.055648 * X - 0.204043 * Y + 1.057311 * Z) / YN]   # B
+        # Only YN is used (see docstring)
+        res  = self._XYZ2RGB @ np.vstack((X, Y, Z))
+        res *= 1. / YN
+        return list(res)  # [R, G, B]
 
 
     # -------------------------------------------------------------------
@@ -472,7 +609,7 @@ class colorlib:
     ##          Z]`).
     ##      """
 
-    ##      __fname__ = inspect.stack()[0][3] # Name of this method
+    ##      __fname__ = "sRGB_to_XYZ"
     ##      n = len(R) # Number of colors
 
     ##      # Loading definition of white
@@ -513,7 +650,7 @@ class colorlib:
     ##          of `numpy.ndarray`'s of the same length as the inputs (`[R, G, B]`).
     ##      """
 
-    ##      __fname__ = inspect.stack()[0][3] # Name of this method
+    ##      __fname__ = "XYZ_to_sRGB"
     ##      n = len(X) # Number of colors
 
     ##      # Loading definition of white
@@ -536,7 +673,7 @@ class colorlib:
     ## ----- CIE-XYZ <-> CIE-LAB ----- */
 
 
-    def LAB_to_XYZ(self, L, A, B, XN = None, YN = None, ZN = None):
+    def LAB_to_XYZ(self, L, A, B, XN = None, YN = None, ZN = None, _check = True):
         """Convert CIELAB to CIEXYZ
 
         `L`, `A`, and `B` specify the values in the three coordinates of the
@@ -553,59 +690,44 @@ class colorlib:
                 When not specified (all `None`) a default white point is used.
             YN: See `XN`.
             ZN: See `XN`.
+            _check (bool): Internal; if `False` the input checks are skipped,
+                used when the inputs have already been validated.
 
         Returns:
             list: Returns corresponding coordinates of CIE chromaticities as a
             list of `numpy.ndarray`s of the same length as the inputs (`[X, Y, Z]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LAB_to_XYZ"
         n = len(L) # Number of colors
 
         # Loading definition of white
         [XN, YN, ZN] = self._get_white_(__fname__, n, XN, YN, ZN)
 
         # Checking input
-        self._check_input_arrays_(__fname__, L = L, A = A, B = B)
+        if _check: self._check_input_arrays_(__fname__, L = L, A = A, B = B)
 
-        # Result arrays
-        X = np.ndarray(len(L), dtype = "float"); X[:] = 0.
-        Y = np.ndarray(len(L), dtype = "float"); Y[:] = 0.
-        Z = np.ndarray(len(L), dtype = "float"); Z[:] = 0.
-
-        # Calculate Y
-        for i,val in np.ndenumerate(L):
-            if   val <= 0:    Y[i] = 0.
-            elif val <= 8.0:  Y[i] = val * YN[i] / self._KAPPA
-            elif val <= 100.: Y[i] = YN[i] * np.power((val + 16.) / 116., 3.)
-            else:             Y[i] = YN[i]
-
-        fy = np.ndarray(len(Y), dtype = "float")
-        for i,val in np.ndenumerate(Y):
-            if val <= (self._EPSILON * YN[i]):
-                fy[i] = (self._KAPPA / 116.) * val / YN[i] + 16. / 116.
-            else:
-                fy[i] = np.power(val / YN[i], 1. / 3.)
+        # Calculate Y (relative to white, y = Y / YN)
+        y = np.where(L <= 0., 0.,
+            np.where(L <= 8., L * (1. / self._KAPPA),
+            np.where(L <= 100., np.power((L + 16.) * (1. / 116.), 3.), 1.)))
+        Y = YN * y
+
+        fy = np.where(y <= self._EPSILON, self._KAPPA116 * y + 16. / 116., np.cbrt(y))
 
         # Calculate X
-        fx = fy + (A / 500.)
-        for i,val in np.ndenumerate(fx):
-            if np.power(val, 3.) <= self._EPSILON:
-                X[i] = XN[i] * (val - 16. / 116.) / (self._KAPPA / 116.)
-            else:
-                X[i] = XN[i] * np.power(val, 3.)
+        fx  = fy + A * (1. / 500.)
+        fx3 = np.power(fx, 3.)
+        X   = XN * np.where(fx3 <= self._EPSILON, (fx - 16. / 116.) * self._INV_KAPPA116, fx3)
 
         # Calculate Z
-        fz = fy - (B / 200.)
-        for i,val in np.ndenumerate(fz):
-            if np.power(val, 3.) <= self._EPSILON:
-                Z[i] = ZN[i] * (val - 16. / 116.) / (self._KAPPA / 116.)
-            else:
-                Z[i] = ZN[i] * np.power(val, 3)
+        fz  = fy - B * (1. / 200.)
+        fz3 = np.power(fz, 3.)
+        Z   = ZN * np.where(fz3 <= self._EPSILON, (fz - 16. / 116.) * self._INV_KAPPA116, fz3)
 
         return [X, Y, Z]
 
-    def XYZ_to_LAB(self, X, Y, Z, XN = None, YN = None, ZN = None):
+    def XYZ_to_LAB(self, X, Y, Z, XN = None, YN = None, ZN = None, _check = True):
         """Convert CIEXYZ to CIELAB
 
         `X`, `Y`, and `Z` specify the values in the three coordinates of the
@@ -622,47 +744,41 @@ class colorlib:
                 When not specified (all `None`) a default white point is used.
             YN: See `XN`.
             ZN: See `XN`.
+            _check (bool): Internal; if `False` the input checks are skipped,
+                used when the inputs have already been validated.
 
         Returns:
             list: Returns corresponding coordinates of CIE chromaticities as
             a list of `numpy.ndarray`s of the same length as the inputs (`[L, A, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_LAB"
         n = len(X) # Number of colors
 
         # Loading definition of white
         [XN, YN, ZN] = self._get_white_(__fname__, n, XN, YN, ZN)
 
         # Checking input
-        self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
+        if _check: self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
 
-        # Support function
-        def f(t, _KAPPA, _EPSILON):
-            for i,val in np.ndenumerate(t):
-                if val > _EPSILON:
-                    t[i] = np.power(val, 1./3.)
-                else:
-                    t[i] = (_KAPPA / 116.) * val + 16. / 116.
-            return t
+        # Scaling; multiply by the reciprocal of the white point
+        xt = self._lab_f_(X * (1. / XN))
+        yt = self._lab_f_(Y * (1. / YN))
+        zt = self._lab_f_(Z * (1. / ZN))
 
-        # Scaling
-        xr = X / XN;
-        yr = Y / YN;
-        zr = Z / ZN;
+        # L follows from yt for both branches of _lab_f_
+        return [116. * yt - 16., 500. * (xt - yt), 200. * (yt - zt)]  # [L, A, B]
 
-        # Calculate L
-        L = np.ndarray(len(X), dtype = "float"); L[:] = 0.
-        for i,val in np.ndenumerate(yr):
-            if val > self._EPSILON:
-                L[i] = 116. * np.power(val, 1./3.) - 16.
-            else:
-                L[i] = self._KAPPA * val
+    def _lab_f_(self, t):
+        """Piecewise Function for CIEXYZ to CIELAB
+
+        Args:
+            t (numpy.ndarray): Coordinates scaled by the white point.
 
-        xt = f(xr, self._KAPPA, self._EPSILON);
-        yt = f(yr, self._KAPPA, self._EPSILON);
-        zt = f(zr, self._KAPPA, self._EPSILON);
-        return [L, 500. * (xt - yt), 200. * (yt - zt)]  # [L, A, B]
+        Returns:
+            numpy.ndarray: Returns the transformed coordinates.
+        """
+        return np.where(t > self._EPSILON, np.cbrt(t), self._KAPPA116 * t + 16. / 116.)
 
 
     # -------------------------------------------------------------------
@@ -695,7 +811,7 @@ class colorlib:
     ##         `numpy.ndarray`'s of the same length as the inputs (`[L, A, B]`).
     ##     """
 
-    ##     __fname__ = inspect.stack()[0][3] # Name of this method
+    ##     __fname__ = "XYZ_to_HLAB"
     ##     n = len(X) # Number of colors
 
     ##     # Loading definition of white
@@ -733,7 +849,7 @@ class colorlib:
     ##         `numpy.ndarray`'s of the same length as the inputs (`[X, Y, Z]`).
     ##     """
 
-    ##     __fname__ = inspect.stack()[0][3] # Name of this method
+    ##     __fname__ = "HLAB_to_XYZ"
     ##     n = len(L) # Number of colors
 
     ##     # Loading definition of white
@@ -776,19 +892,14 @@ class colorlib:
             `numpy.ndarray`s of the same length as the inputs (`[L, A, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LAB_to_polarLAB"
 
         # Checking input
         self._check_input_arrays_(__fname__, L = L, A = A, B = B)
 
-        # Compute H
-        H = self._RAD2DEG(np.arctan2(B, A))
-        for i,val in np.ndenumerate(H):
-            while val > 360.:   val -= 360.
-            while val <   0.:   val += 360.
-            H[i] = val
-        # Compute C
-        C = np.sqrt(A * A + B * B)
+        # Compute H (wrapped to [0, 360)) and C
+        H = np.mod(self._RAD2DEG(np.arctan2(B, A)), 360.)
+        C = np.hypot(A, B)
 
         return [L, C, H]
 
@@ -809,15 +920,13 @@ class colorlib:
             `numpy.ndarray`s of the same length as the inputs (`[L, A, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "polarLAB_to_LAB"
 
         # Checking input
         self._check_input_arrays_(__fname__, L = L, H = H, C = C)
 
-        A = np.cos(self._DEG2RAD(H)) * C
-        B = np.sin(self._DEG2RAD(H)) * C
-
-        return [L, A, B]
+        H = self._DEG2RAD(H)
+        return [L, C * np.cos(H), C * np.sin(H)] # [L, A, B]
 
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
@@ -841,38 +950,24 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "sRGB_to_HSV"
 
         # Checking input
         self._check_input_arrays_(__fname__, r = r, g = g, b = b)
 
-        # Support function
-        def gethsv(r, g, b):
-            x = np.min([r, g, b])
-            y = np.max([r, g, b])
-            if y != x:
-                f = g - b if r == x else b - r if g == x else r - g
-                i = 3. if r == x else 5. if g == x else 1.
-                h = 60. * (i - f /(y - x))
-                s = (y - x)/y
-                v = y
-            else:
-                h = 0.
-                s = 0.
-                v = y
-            return [h, s, v]
-
-        # Result arrays
-        h = np.ndarray(len(r), dtype = "float"); h[:] = 0.
-        s = np.ndarray(len(r), dtype = "float"); s[:] = 0.
-        v = np.ndarray(len(r), dtype = "float"); v[:] = 0.
+        # Minimum, maximum, and range
+        x = np.minimum(np.minimum(r, g), b)
+        y = np.maximum(np.maximum(r, g), b)
+        d = y - x
 
-        # Calculate h/s/v
-        for i in range(0, len(r)):
-            tmp = gethsv(r[i], g[i], b[i])
-            h[i] = tmp[0]; s[i] = tmp[1]; v[i] = tmp[2]
+        # Hue depends on which channel is the minimum
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            f = np.select([r == x, g == x], [g - b, b - r], r - g)
+            i = np.select([r == x, g == x], [3., 5.], 1.)
+            h = np.where(d == 0, 0., 60. * (i - f / d))
+            s = np.where(d == 0, 0., d / y)
 
-        return [h, s, v]
+        return [h, s, y]
 
 
     def HSV_to_sRGB(self, h, s, v):
@@ -892,46 +987,26 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "HSV_to_sRGB"
 
         # Checking input
         self._check_input_arrays_(__fname__, h = h, s = s, v = v)
 
-        # Support function
-        def getrgb(h, s, v):
-
-            # If Hue is not defined:
-            if h == np.nan: return np.repeat(v, 3)
+        # Convert to [0-6]
+        h = h / 60.
+        i = np.floor(h)
+        f = h - i
+        f = np.where(np.mod(i, 2) == 0, 1. - f, f) # if i is even
 
-            # Convert to [0-6]
-            h = h / 60.
-            i = np.floor(h)
-            f = h - i
+        m = v * (1. - s)
+        n = v * (1. - s * f)
 
-            if (i % 2) == 0:  # if i is even 
-                f = 1 - f
-
-            m = v * (1 - s)
-            n = v * (1 - s * f)
-            if i in [0, 6]:    return [v, n, m]
-            elif i == 1:       return [n, v, m]
-            elif i == 2:       return [m, v, n]
-            elif i == 3:       return [m, n, v]
-            elif i == 4:       return [n, m, v]
-            elif i == 5:       return [v, m, n]
-            else:
-                raise Exception(f"ended up in a non-defined ifelse with i = {i:d}")
-
-        # Result arrays
-        r = np.ndarray(len(h), dtype = "float"); r[:] = 0.
-        g = np.ndarray(len(h), dtype = "float"); g[:] = 0.
-        b = np.ndarray(len(h), dtype = "float"); b[:] = 0.
-
-        for i in range(0,len(h)):
-           tmp = getrgb(h[i], s[i], v[i])
-           r[i] = tmp[0]; g[i] = tmp[1]; b[i] = tmp[2]
-
-        return [r, g, b]
+        # Sextant; 6 (h == 360) is identical to 0, non-finite hues use
+        # the last sextant. Picks [r, g, b] out of [v, n, m] by lookup.
+        i   = np.mod(i, 6)
+        i   = np.where(np.isfinite(i), i, 5).astype(np.intp)
+        vnm = (v, n, m)
+        return [np.choose(self._HSV_SEXTANTS[:, j][i], vnm) for j in range(3)]
 
 
     # -------------------------------------------------------------------
@@ -955,45 +1030,25 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "sRGB_to_HLS"
 
         # Checking input
         self._check_input_arrays_(__fname__, r = r, g = g, b = b)
 
-        # Support function
-        def gethls(r, g, b):
-            min = np.min([r, g, b])
-            max = np.max([r, g, b])
-
-            l = (max + min)/2.;
+        # Minimum, maximum, and range
+        mn = np.minimum(np.minimum(r, g), b)
+        mx = np.maximum(np.maximum(r, g), b)
+        d  = mx - mn
 
-            if max != min:
-                if   l <  0.5: s = (max - min) / (max + min)
-                elif l >= 0.5: s = (max - min) / (2. - max - min)
+        l = (mx + mn) / 2.
 
-                if r == max:  h = (g - b) / (max - min);
-                if g == max:  h = 2. + (b - r) / (max - min);
-                if b == max:  h = 4. + (r - g) / (max - min);
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            s = np.where(l < 0.5, d / (mx + mn), d / (2. - mx - mn))
+            h = 60. * np.select([b == mx, g == mx], [4. + (r - g) / d, 2. + (b - r) / d], (g - b) / d)
+        h = np.where(h < 0., h + 360., h)
 
-                h = h * 60.;
-                if h < 0.:    h = h + 360.;
-                if h > 360.:  h = h - 360.;
-            else:
-                s = 0
-                h = 0;
-
-            return [h, l, s]
-
-        # Result arrays
-        h = np.ndarray(len(r), dtype = "float"); h[:] = 0.
-        l = np.ndarray(len(r), dtype = "float"); l[:] = 0.
-        s = np.ndarray(len(r), dtype = "float"); s[:] = 0.
-
-        for i in range(0,len(h)):
-           tmp = gethls(r[i], g[i], b[i])
-           h[i] = tmp[0]; l[i] = tmp[1]; s[i] = tmp[2]
-
-        return [h, l, s]
+        # Achromatic colors
+        return [np.where(d == 0, 0., h), l, np.where(d == 0, 0., s)]
 
 
     def HLS_to_sRGB(self, h, l, s):
@@ -1012,33 +1067,18 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "HLS_to_sRGB"
 
         # Checking input
         self._check_input_arrays_(__fname__, h = h, l = l, s = s)
 
-        # Support function
-        def getrgb(h, l, s):
-            p2 = l * (1. + s) if l <= 0.5 else l + s - (l * s)
-            p1 = 2 * l - p2
-
-            # If saturation is zero
-            if (s == 0):    return np.repeat(l, 3)
-            # Else
-            return [self._qtrans(p1, p2, h + 120.),   # r
-                    self._qtrans(p1, p2, h),          # g
-                    self._qtrans(p1, p2, h - 120.)]   # b
-
-        # Result arrays
-        r = np.ndarray(len(h), dtype = "float"); r[:] = 0.
-        g = np.ndarray(len(h), dtype = "float"); g[:] = 0.
-        b = np.ndarray(len(h), dtype = "float"); b[:] = 0.
-
-        for i in range(0,len(r)):
-           tmp = getrgb(h[i], l[i], s[i])
-           r[i] = tmp[0]; g[i] = tmp[1]; b[i] = tmp[2]
+        p2 = np.where(l <= 0.5, l * (1. + s), l + s - (l * s))
+        p1 = 2 * l - p2
 
-        return [r, g, b]
+        # If saturation is zero r = g = b = l
+        return [np.where(s == 0, l, self._qtrans(p1, p2, h + 120.)),   # r
+                np.where(s == 0, l, self._qtrans(p1, p2, h)),          # g
+                np.where(s == 0, l, self._qtrans(p1, p2, h - 120.))]   # b
 
 
     # -------------------------------------------------------------------
@@ -1061,22 +1101,23 @@ class colorlib:
             list: Returns a list of `numpy.ndarray`s (`[u, v]`). 
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_uv"
 
         # Checking input
         self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
 
         # Result array
-        x = np.ndarray(len(X), dtype = "float"); x[:] = 0.
-        y = np.ndarray(len(X), dtype = "float"); y[:] = 0.
+        x = np.zeros(len(X), dtype = np.float64)
+        y = np.zeros(len(X), dtype = np.float64)
 
         t = X + Y + Z
-        idx = np.where(t != 0)
-        x[idx] = X[idx] / t[idx];
-        y[idx] = Y[idx] / t[idx];
+        np.divide(X, t, out = x, where = t != 0)
+        np.divide(Y, t, out = y, where = t != 0)
 
-        return [2.0 * x / (6. * y - x + 1.5),    # u
-                4.5 * y / (6. * y - x + 1.5)]    # v
+        # Shared denominator
+        inv = 1. / (6. * y - x + 1.5)
+        return [2.0 * x * inv,    # u
+                4.5 * y * inv]    # v
 
     def XYZ_to_LUV(self, X, Y, Z, XN = None, YN = None, ZN = None):
         """Convert CIEXYZ to CIELUV.
@@ -1101,10 +1142,11 @@ class colorlib:
             a list of `numpy.ndarray`s of the same length as the inputs (`[L, U, V]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_LUV"
         n = len(X) # Number of colors
 
         # Loading definition of white
+        white = (XN, YN, ZN)
         [XN, YN, ZN] = self._get_white_(__fname__, n, XN, YN, ZN)
 
         # Checking input
@@ -1112,16 +1154,17 @@ class colorlib:
 
         # Convert X/Y/Z and XN/YN/ZN to uv
         [u,  v]  = self.XYZ_to_uv(X,  Y,  Z )
-        [uN, vN] = self.XYZ_to_uv(XN, YN, ZN)
+        [uN, vN] = self._get_white_uv_(white, XN, YN, ZN)
 
         # Calculate L
-        L = np.ndarray(len(X), dtype = "float"); L[:] = 0.
         y = Y / YN
-        for i,val in np.ndenumerate(y):
-            L[i] = 116. * np.power(val, 1./3.) - 16. if val > self._EPSILON else self._KAPPA * val
+        L = np.where(y > self._EPSILON, 116. * np.cbrt(y) - 16., self._KAPPA * y)
 
-        # Calculate U/V
-        return [L, 13. * L * (u - uN), 13. * L * (v - vN)]  # [L, U, V]
+        # Calculate U/V; u and v are temporaries and modified in place
+        L13 = 13. * L
+        u -= uN; u *= L13
+        v -= vN; v *= L13
+        return [L, u, v]  # [L, U, V]
 
     def LUV_to_XYZ(self, L, U, V, XN = None, YN = None, ZN = None):
         """Convert CIELUV to CIELAB
@@ -1146,44 +1189,34 @@ class colorlib:
             a list of `numpy.ndarray`s of the same length as the inputs (`[L, A, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LUV_to_XYZ"
         n = len(L) # Number of colors
 
         # Loading definition of white
+        white = (XN, YN, ZN)
         [XN, YN, ZN] = self._get_white_(__fname__, n, XN, YN, ZN)
 
         # Checking input
         self._check_input_arrays_(__fname__, L = L, U = U, V = V)
 
-        # Result arrays
-        X = np.ndarray(len(L), dtype = "float"); X[:] = 0.
-        Y = np.ndarray(len(L), dtype = "float"); Y[:] = 0.
-        Z = np.ndarray(len(L), dtype = "float"); Z[:] = 0.
-
         # Check for which values we do have to do the transformation
-        def fun(L, U, V):
-            return False if L <= 0. and U == 0. and V == 0. else True
-        idx = np.where([fun(L[i], U[i], V[i]) for i in range(0, len(L))])[0]
-        if len(idx) == 0: return [X, Y, Z]
+        idx = ~((L <= 0.) & (U == 0.) & (V == 0.))
+        if not np.any(idx):
+            return [np.zeros(n, dtype = np.float64) for i in range(3)]
 
         # Compute Y
-        for i in idx:
-            Y[i] = YN[i] * (np.power((L[i] + 16.)/116., 3.) if L[i] > 8. else L[i] / self._KAPPA)
-
-        # Calculate X/Z
-        from numpy import finfo, fmax
+        Y = YN * np.where(L > 8., np.power((L + 16.) / 116., 3.), L / self._KAPPA)
 
-        # Avoiding division by zero
-        eps = np.finfo(float).eps*10
-        L = fmax(eps, L)
-
-        [uN, vN] = self.XYZ_to_uv(XN, YN, ZN)
-        u = U / (13. * L) + uN
-        v = V / (13. * L) + vN
+        # Calculate X/Z; avoiding division by zero
+        inv = 1. / (13. * np.maximum(L, np.finfo(float).eps * 10))
+        [uN, vN] = self._get_white_uv_(white, XN, YN, ZN)
+        u = U * inv + uN
+        v = V * inv + vN
         X =  9.0 * Y * u / (4 * v)
         Z =  -X / 3. - 5. * Y + 3. * Y / v
 
-        return [X, Y, Z]
+        # Black (L <= 0, U = V = 0) maps to zero
+        return [np.where(idx, X, 0.), np.where(idx, Y, 0.), np.where(idx, Z, 0.)]
 
 
     ## ----- LUV <-> polarLUV ----- */
@@ -1207,17 +1240,13 @@ class colorlib:
             also known as `[H, C, L]` coordinates.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LUV_to_polarLUV"
 
         self._check_input_arrays_(__fname__, L = L, U = U, V = V)
 
         # Calculate polarLUV coordinates
-        C = np.sqrt(U * U + V * V)
-        H = self._RAD2DEG(np.arctan2(V, U))
-        for i,val in np.ndenumerate(H):
-            while val > 360: val -= 360.
-            while val < 0.:  val += 360.
-            H[i] = val
+        C = np.hypot(U, V)
+        H = np.mod(self._RAD2DEG(np.arctan2(V, U)), 360.)
 
         return [L, C, H]
 
@@ -1238,7 +1267,7 @@ class colorlib:
             `numpy.ndarray`s of the same length as the inputs (`[L, U, V]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "polarLUV_to_LUV"
 
         # Checking input
         self._check_input_arrays_(__fname__, L = L, C = C, H = H)
@@ -1254,7 +1283,9 @@ class colorlib:
         blue coordinates from the Standard RGB color space to hex colors.
 
         Args:
-            r (numpy.ndarray): Intensities for red (`[0., 1.,]`).
+            r (numpy.ndarray): Intensities for red (`[0., 1.,]`). If `r`, `g`,
+                and `b` are all of dtype `uint8` they are interpreted as 8-bit
+                intensities (`[0, 255]`) and directly looked up.
             g (numpy.ndarray): Intensities for green (`[0., 1.,]`).
             b (numpy.ndarray): Intensities for blue (`[0., 1.,]`).
             fixup (bool): Whether or not the `rgb` values should be corrected
@@ -1265,60 +1296,40 @@ class colorlib:
             list: A list with hex color str.
         """
 
-        # Color fixup: limit r/g/b to [0-1]
-        def rgbfixup(r, g, b):
-            def fun(x):
-                return np.asarray([np.max([0, np.min([1, e])]) \
-                       if np.isfinite(e) else np.nan for e in x])
-            return [fun(r), fun(g), fun(b)]
-
-        def rgbcleanup(r, g, b):
-            def fun(x):
-                tol = 1. / (2 * 255.)
-                # Allow tiny correction close to 0. and 1.
-                x[np.logical_and(x < 0.0, x >= -tol)] = 0.0
-                x[np.logical_and(x > 1.0, x <= 1.0 + tol)] = 1.0
-                return np.asarray([e if np.logical_and(e >= 0., e <= 1.)
-                       else np.nan for e in x])
-            return [fun(r), fun(g), fun(b)]
+        # 8-bit input; always valid, no float conversion needed
+        if all(isinstance(x, np.ndarray) and x.dtype == np.uint8 for x in (r, g, b)):
+            return np.char.add(np.char.add(np.char.add("#", self._HEX_PAIRS[r]),
+                               self._HEX_PAIRS[g]), self._HEX_PAIRS[b])
 
-        # Checking which r/g/b values are outside limits.
-        # This only happens if fixup = FALSE.
-        def validrgb(r, g, b):
-            idxr = np.isfinite(r)
-            idxg = np.isfinite(g)
-            idxb = np.isfinite(b)
-            return np.where(idxr * idxg * idxb)[0]
+        # Color fixup: limit r/g/b to [0-1], non-finite values become nan
+        def rgbfixup(x):
+            return np.where(np.isfinite(x), np.clip(x, 0., 1.), np.nan)
 
-        # Support function to create hex coded colors
-        def gethex(r, g, b):
-
-            # Converts int to hex string
-            def applyfun(x):
-                x = np.asarray(x * 255. + .5, dtype = int)
-                return f"#{x[0]:02X}{x[1]:02X}{x[2]:02X}"
-
-            h = np.vstack([r,g,b]).transpose().flatten().reshape([len(r), 3])
-            return np.apply_along_axis(applyfun, 1, h)
+        def rgbcleanup(x):
+            tol = 1. / (2 * 255.)
+            # Allow tiny correction close to 0. and 1.
+            x = np.where(np.logical_and(x < 0.0, x >= -tol), 0.0, x)
+            x = np.where(np.logical_and(x > 1.0, x <= 1.0 + tol), 1.0, x)
+            return np.where(np.logical_and(x >= 0., x <= 1.), x, np.nan)
 
         # Let's do the conversion!
-        if fixup: [r, g, b] = rgbfixup(r, g, b)
-        else:     [r, g, b] = rgbcleanup(r, g, b)
+        rgb = np.vstack((r, g, b))
+        rgb = rgbfixup(rgb) if fixup else rgbcleanup(rgb)
 
-        # Create return array
-        res = np.ndarray(len(r), dtype = "|S7"); res[:] = ""
-
-        # Check valid r/g/b coordinates
-        valid = validrgb(r, g, b)
-        if len(valid) > 0:
-            # Convert valid colors to hex
-            res[valid] = gethex(r[valid], g[valid], b[valid])
+        # Checking which r/g/b values are outside limits.
+        # This only happens if fixup = FALSE.
+        valid = np.all(np.isfinite(rgb), axis = 0)
 
-        # Create return list with NAN's for invalid colors
-        res = [None if len(x) == 0 else x.decode() for x in res]
+        # Convert valid colors to hex via lookup of the two-digit hex codes
+        x   = np.asarray(rgb[:, valid] * 255. + .5, dtype = np.uint8)
+        hex_ = np.char.add(np.char.add(np.char.add("#", self._HEX_PAIRS[x[0]]),
+                           self._HEX_PAIRS[x[1]]), self._HEX_PAIRS[x[2]])
+        if np.all(valid): return hex_
 
-        # Return numpy array
-        return np.asarray(res)
+        # Create return array with None for invalid colors
+        res = np.full(len(valid), None, dtype = object)
+        res[valid] = hex_
+        return res
 
     def hex_to_sRGB(self, hex_, gamma = 2.4):
         """Convert Hex Colors to Standard RGB (sRGB)
@@ -1339,23 +1350,24 @@ class colorlib:
 
         # Check for valid hex colors
         def validhex(hex_):
-            from re import compile
-            pat = compile("^#[0-9A-Fa-f]{6}([0-9]{2})?$")
-            from re import match
-            return np.where([None if x is None else pat.match(x) is not None for x in hex_])[0]
+            match = _HEX_RE.match
+            return np.flatnonzero([x is not None and match(x) is not None for x in hex_])
 
-        # Convert hex to rgb
+        # Convert hex to rgb; decodes the 'RRGGBB' characters of all
+        # colors at once from a single byte buffer
         def getrgb(x):
-            def applyfun(x):
-                return np.asarray([int(x[i:i+2], 16) for i in (1, 3, 5)])
-            rgb = [applyfun(e) for e in x]
-            rgb = np.vstack(rgb).transpose().flatten().reshape([3,len(x)])
-            return [rgb[0] / 255., rgb[1] / 255., rgb[2] / 255.]
+            buf = "".join([e[1:7] for e in x]).encode("ascii")
+            buf = np.frombuffer(buf, dtype = np.uint8).reshape([len(x), 6])
+            # Characters (0-9, A-F, a-f) to integers 0-15
+            val = np.where(buf >= ord("a"), buf - (ord("a") - 10),
+                  np.where(buf >= ord("A"), buf - (ord("A") - 10), buf - ord("0")))
+            rgb = val[:, 0::2] * 16 + val[:, 1::2]
+            return [rgb[:, 0] / 255., rgb[:, 1] / 255., rgb[:, 2] / 255.]
 
         # Result arrays
-        r = np.ndarray(len(hex_), dtype = "float"); r[:] = np.nan 
-        g = np.ndarray(len(hex_), dtype = "float"); g[:] = np.nan 
-        b = np.ndarray(len(hex_), dtype = "float"); b[:] = np.nan 
+        r = np.full(len(hex_), np.nan)
+        g = np.full(len(hex_), np.nan)
+        b = np.full(len(hex_), np.nan)
 
         # Check valid hex colors
         valid = validhex(hex_)
@@ -1388,40 +1400,8 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
-
-        # Checking input
-        self._check_input_arrays_(__fname__, r = r, g = g, b = b)
-
-        # Create 2d numpy array where the first dimension corresponds
-        # to specific colors, the second one to [r, g, b] of that color.
-        tmp = np.transpose(np.stack((r, g, b)))
-
-        def gethls(x):
-            """x is expected to be a numpy array of length 3 with [r, g, b] coordinates."""
-
-            mn = np.min(x)
-            mx = np.max(x)
-
-            # If minimum equals maximum we know the solution already
-            if mn == mx:        return [0., mn, 0.] # [h, l, s]
-
-            # Else do the calculations
-            l = (mn + mx) / 2.
-            s = (mx - mn) / (mx + mn) if l < 0.5 else (mx - mn) / (2. - mx - mn)
-
-            # x[0] is 'r', x[1] = 'g', x[2] = 'b'
-            if x[0] == mx:      h = 60. * (x[1] - x[2]) / (mx - mn)
-            elif x[1] == mx:    h = 60. * (2. + (x[2] - x[0]) / (mx - mn))
-            else:               h = 60. * (4. + (x[0] - x[1]) / (mx - mn))
-
-            if h < 0.:          h = h + 360.
-            elif h > 360.:      h = h - 360.
-
-            return [h, l, s]
-
-
-        return np.transpose([gethls(x) for x in tmp])
+        # Same computation as for sRGB
+        return self.sRGB_to_HLS(r, g, b)
 
 
     # -------------------------------------------------------------------
@@ -1443,30 +1423,8 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
-
-        # Checking input
-        self._check_input_arrays_(__fname__, h = h, l = l, s = s)
-
-        # Create 2d numpy array where the first dimension corresponds
-        # to specific colors, the second one to [r, g, b] of that color.
-        tmp = np.transpose(np.stack((h, l, s)))
-
-        def getrgb(x):
-            """x is expected to be a numpy array of length 3 with [h, l, s] coordinates."""
-
-            # If saturation equals zero, return [l, l, l]
-            if x[2] == 0.: return [x[1], x[1], x[1]]
-
-            # x[0] = 'h', x[1] = 'l', x[2] = 's'
-            p2 = x[1] * (1 + x[2]) if x[1] <= 0.5 else x[1] + x[2] - (x[1] * x[2])
-            p1 = 2 * x[1] - p2
-
-            return [self._qtrans(p1, p2, x[0] + 120.),
-                    self._qtrans(p1, p2, x[0]),
-                    self._qtrans(p1, p2, x[0] - 120.)]
-
-        return np.transpose([getrgb(x) for x in tmp])
+        # Same computation as for sRGB
+        return self.HLS_to_sRGB(h, l, s)
 
     # -------------------------------------------------------------------
     # Direct conversion ('shortcut') from RGB to HSV
@@ -1487,32 +1445,8 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
-
-        # Checking input
-        self._check_input_arrays_(__fname__, r = r, g = g, b = b)
-
-        # Create 2d numpy array where the first dimension corresponds
-        # to specific colors, the second one to [r, g, b] of that color.
-        tmp = np.transpose(np.stack((r, g, b)))
-
-        def gethsv(x):
-            """x is expected to be a numpy array of length 3 with [r, g, b] coordinates."""
-
-            mn = np.min(x)
-            mx = np.max(x)
-
-            # If minimum equals maximum we know the solution already
-            if mn == mx:        return [0., 0., mx] # [h, s, v]
-
-            # Else calculate new dimensions
-            f = (x[1] - x[2]) if x[0] == mn else x[2] - x[0] if x[1] == mn else x[0] - x[1]
-            i = 3. if x[0] == mn else 5. if x[1] == mn else 1.
-
-            # Returning [h, s, v]
-            return [60. * (i - f / (mx - mn)),  (mx - mn) / mx,  mx]
-
-        return np.transpose([gethsv(x) for x in tmp])
+        # Same computation as for sRGB
+        return self.sRGB_to_HSV(r, g, b)
 
 
     # -------------------------------------------------------------------
@@ -1534,35 +1468,78 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
-
-        # Checking input
-        self._check_input_arrays_(__fname__, h = h, s = s, v = v)
-
-        # Create 2d numpy array where the first dimension corresponds
-        # to specific colors, the second one to [r, g, b] of that color.
-        tmp = np.transpose(np.stack((h, s, v)))
-
-        def getrgb(x):
-            """x is expected to be a numpy array of length 3 with [h, s, v] coordinates."""
-
-            h = x[0] / 60.       # Convert to [0, 6]
-            i = np.int8(np.floor(h))
-            f = h - i
-            if i % 2 == 0:    f = 1. - f  # if i is even
-
-            m = x[2] * (1. - x[1])
-            n = x[2] * (1. - x[1] * f)
-
-            if i == 0 or i == 6:   return [x[2], n, m]
-            elif i == 1:           return [n, x[2], m]
-            elif i == 2:           return [m, x[2], n]
-            elif i == 3:           return [m, n, x[2]]
-            elif i == 4:           return [n, m, x[2]]
-            elif i == 5:           return [x[2], m, n]
-
-        return np.transpose([getrgb(x) for x in tmp])
-
+        # Same computation as for sRGB
+        return self.HSV_to_sRGB(h, s, v)
+
+
+# Conversion paths used by the `to()` methods of the color objects;
+# (class name, target color space) -> color spaces to convert through,
+# ending in the target. Single-step conversions are handled by `to()`.
+_VIA = {
+    ("polarLUV", "CIEXYZ"):    ("CIELUV", "CIEXYZ"),
+    ("polarLUV", "CIELAB"):    ("CIELUV", "CIEXYZ", "CIELAB"),
+    ("polarLUV", "RGB"):       ("CIELUV", "CIEXYZ", "RGB"),
+    ("polarLUV", "sRGB"):      ("CIELUV", "CIEXYZ", "sRGB"),
+    ("polarLUV", "polarLAB"):  ("CIELUV", "CIEXYZ", "CIELAB", "polarLAB"),
+    ("polarLUV", "hex"):       ("CIELUV", "CIEXYZ", "sRGB", "hex"),
+
+    ("CIELUV", "CIELAB"):      ("CIEXYZ", "CIELAB"),
+    ("CIELUV", "RGB"):         ("CIEXYZ", "RGB"),
+    ("CIELUV", "sRGB"):        ("CIEXYZ", "RGB", "sRGB"),
+    ("CIELUV", "polarLAB"):    ("CIEXYZ", "CIELAB", "polarLAB"),
+    ("CIELUV", "hex"):         ("CIEXYZ", "RGB", "sRGB", "hex"),
+
+    ("CIEXYZ", "polarLAB"):    ("CIELAB", "polarLAB"),
+    ("CIEXYZ", "HCL"):         ("CIELUV", "HCL"),
+    ("CIEXYZ", "polarLUV"):    ("CIELUV", "polarLUV"),
+    ("CIEXYZ", "sRGB"):        ("RGB", "sRGB"),
+    ("CIEXYZ", "hex"):         ("RGB", "sRGB", "hex"),
+
+    ("RGB", "hex"):            ("sRGB", "hex"),
+    ("RGB", "CIELUV"):         ("CIEXYZ", "CIELUV"),
+    ("RGB", "CIELAB"):         ("CIEXYZ", "CIELAB"),
+    ("RGB", "HCL"):            ("CIEXYZ", "CIELUV", "HCL"),
+    ("RGB", "polarLUV"):       ("CIEXYZ", "CIELUV", "polarLUV"),
+    ("RGB", "polarLAB"):       ("CIEXYZ", "CIELAB", "polarLAB"),
+
+    ("sRGB", "CIEXYZ"):        ("RGB", "CIEXYZ"),
+    ("sRGB", "CIELUV"):        ("RGB", "CIEXYZ", "CIELUV"),
+    ("sRGB", "CIELAB"):        ("RGB", "CIEXYZ", "CIELAB"),
+    ("sRGB", "HCL"):           ("RGB", "CIEXYZ", "CIELUV", "HCL"),
+    ("sRGB", "polarLUV"):      ("RGB", "CIEXYZ", "CIELUV", "polarLUV"),
+    ("sRGB", "polarLAB"):      ("RGB", "CIEXYZ", "CIELAB", "polarLAB"),
+
+    ("CIELAB", "CIELUV"):      ("CIEXYZ", "CIELUV"),
+    ("CIELAB", "HCL"):         ("CIEXYZ", "CIELUV", "HCL"),
+    ("CIELAB", "polarLUV"):    ("CIEXYZ", "CIELUV", "polarLUV"),
+    ("CIELAB", "RGB"):         ("CIEXYZ", "RGB"),
+    ("CIELAB", "sRGB"):        ("CIEXYZ", "RGB", "sRGB"),
+    ("CIELAB", "hex"):         ("CIEXYZ", "RGB", "sRGB", "hex"),
+
+    ("polarLAB", "CIEXYZ"):    ("CIELAB", "CIEXYZ"),
+    ("polarLAB", "CIELUV"):    ("CIELAB", "CIEXYZ", "CIELUV"),
+    ("polarLAB", "HCL"):       ("CIELAB", "CIEXYZ", "CIELUV", "HCL"),
+    ("polarLAB", "polarLUV"):  ("CIELAB", "CIEXYZ", "CIELUV", "polarLUV"),
+    ("polarLAB", "RGB"):       ("CIELAB", "CIEXYZ", "RGB"),
+    ("polarLAB", "sRGB"):      ("CIELAB", "CIEXYZ", "RGB", "sRGB"),
+    ("polarLAB", "hex"):       ("CIELAB", "CIEXYZ", "RGB", "sRGB", "hex"),
+
+    ("HSV", "hex"):            ("sRGB", "hex"),
+    ("HSV", "HLS"):            ("sRGB", "HLS"),
+
+    ("HLS", "hex"):            ("sRGB", "hex"),
+    ("HLS", "HSV"):            ("sRGB", "HSV"),
+
+    ("hexcols", "RGB"):        ("sRGB", "RGB"),
+    ("hexcols", "HLS"):        ("sRGB", "HLS"),
+    ("hexcols", "HSV"):        ("sRGB", "HSV"),
+    ("hexcols", "CIEXYZ"):     ("sRGB", "RGB", "CIEXYZ"),
+    ("hexcols", "CIELUV"):     ("sRGB", "RGB", "CIEXYZ", "CIELUV"),
+    ("hexcols", "CIELAB"):     ("sRGB", "RGB", "CIEXYZ", "CIELAB"),
+    ("hexcols", "HCL"):        ("sRGB", "RGB", "CIEXYZ", "CIELUV", "HCL"),
+    ("hexcols", "polarLUV"):   ("sRGB", "RGB", "CIEXYZ", "CIELUV", "polarLUV"),
+    ("hexcols", "polarLAB"):   ("sRGB", "RGB", "CIEXYZ", "CIELAB", "polarLAB"),
+}
 
 # -------------------------------------------------------------------
 # Color object base class
@@ -1581,7 +1558,9 @@ class colorobject:
     HSV, polarLAB, polarLUV, RGB, and sRGB.
     """
 
-    import numpy as np
+    # Fixed set of instance attributes; identical for all subclasses
+    # (sharing the layout) as `to()` changes the class of an object.
+    __slots__ = ("_data_", "WHITEX", "WHITEY", "WHITEZ", "_gamma_", "n")
 
     # Allowed/defined color spaces
     ALLOWED = ["CIEXYZ", "CIELUV", "CIELAB", "polarLUV", "polarLAB",
@@ -1595,8 +1574,15 @@ class colorobject:
     ALPHA = None
     """Used to store (keep) transparency when needed; will be dropped during conversion."""
 
-    GAMMA = 2.4 # Used to adjust RGB (sRGB_to_RGB and back).
-    """Gamma value used used to adjust RGB colors; currently a fixed value of 2.4."""
+    # Used to adjust RGB (sRGB_to_RGB and back).
+    @property
+    def GAMMA(self):
+        """Gamma value used to adjust RGB colors; defaults to 2.4."""
+        return getattr(self, "_gamma_", 2.4)
+
+    @GAMMA.setter
+    def GAMMA(self, gamma):
+        self._gamma_ = gamma
 
     # Standard representation of colorobject objects.
     def __repr__(self, digits = 2):
@@ -1613,11 +1599,8 @@ class colorobject:
         """
         dims = list(self._data_.keys())    # Dimensions
 
-        from .colorlib import hexcols
-        import numpy as np
-
         # Sorting the dimensions
-        from re import match
+        match = re.match
         if   match("^(hex_|alpha){1,2}$",  "".join(dims)): dims = ["hex_"]
         elif match("^(R|G|B|alpha){3,4}$", "".join(dims)): dims = ["R", "G", "B"]
         elif match("^(L|A|B|alpha){3,4}$", "".join(dims)): dims = ["L", "A", "B"]
@@ -1627,8 +1610,9 @@ class colorobject:
         elif match("^(H|S|V|alpha){3,4}$", "".join(dims)): dims = ["H", "S", "V"]
         elif match("^(H|L|S|alpha){3,4}$", "".join(dims)): dims = ["H", "L", "S"]
 
-        # Number of colors
-        ncol = max([0 if self._data_[x] is None else len(self._data_[x]) for x in dims])
+        # Number of colors; long objects only show the first 30 colors
+        ncol  = max([0 if self._data_[x] is None else len(self._data_[x]) for x in dims])
+        nshow = ncol if ncol <= 40 else 30
 
         # Add 'alpha' to object 'dims' if we have defined alpha values
         # for this colorobject. Else alpha will not be printed.
@@ -1648,22 +1632,21 @@ class colorobject:
         if isinstance(self, hexcols):
             data = {}
             fmt = "".join(["{:", "{:d}.{:d}".format(6 + digits, 3), "f}"])
-            data["hex_"] = np.ndarray(ncol, dtype = "|S7")
-            for n in range(0, ncol):
+            data["hex_"] = np.empty(nshow, dtype = "|S7")
+            for n in range(0, nshow):
                 x = self._data_["hex_"][n]
                 if x is None:
                     data["hex_"][n] = None
                 else:
                     data["hex_"][n] = fmt.format(x) if isinstance(x, float) else x[0:7]
-            data["alpha"] = self.get("alpha")
+            data["alpha"] = self.get("alpha", copy = False)
             fmt = "{:<10s}"
         else:
             fmt = "".join(["{:", "{:d}.{:d}".format(6+digits, digits), "f}"])
             data = self._data_
 
         # Print object content
-        count = 0
-        for n in range(0, ncol):
+        for n in range(0, nshow):
             if (n % 10) == 0: 
                 tmp = "{:3d}: ".format(n+1)
             else:
@@ -1688,13 +1671,11 @@ class colorobject:
                     else:
                         tmp += fmt.format(float(data[d][n]))
 
-            count += 1
             res.append(tmp)
 
-            if count >= 30 and ncol > 40:
-                res.append("".join([" ......"]*len(dims)))
-                res.append("And {:d} more [truncated]".format(ncol - count))
-                break
+        if nshow < ncol:
+            res.append("".join([" ......"]*len(dims)))
+            res.append("And {:d} more [truncated]".format(ncol - nshow))
 
         return "\n".join(res)
 
@@ -1729,13 +1710,11 @@ class colorobject:
         if not isinstance(key, int):
             raise TypeError("argument `key` must be int (index)")
 
-        from copy import deepcopy
-        from numpy import array, newaxis
         res = deepcopy(self)
         for n in list(res._data_.keys()):
             # If None: keep it as it is, else subset
             if res._data_[n] is None: continue
-            res._data_[n] = res._data_[n][newaxis, key]
+            res._data_[n] = res._data_[n][np.newaxis, key]
 
         return res
 
@@ -1831,6 +1810,36 @@ class colorobject:
         """
         for v in via:   self.to(v, fixup = fixup)
 
+    def _to_copy_(self, to, fixup):
+        """Transform a Copy
+
+        Helper function for :py:func:`to` with `inplace = False`.
+
+        Args:
+            to (str): Name of the target color space.
+            fixup (bool): Whether or not to correct invalid rgb values outside
+                `[0., 1.]` if necessary.
+
+        Returns:
+            Returns a new color object of the target color space, the
+            current object stays unchanged.
+        """
+        x = self._copy_()
+        x.to(to, fixup = fixup)
+        return x
+
+    def _copy_(self):
+        """Copy Color Object
+
+        Cheaper alternative to `deepcopy`; only the coordinates are copied.
+
+        Returns:
+            Returns a copy of the current object.
+        """
+        x = copy(self)
+        x._data_ = {k: copy(v) for k,v in self._data_.items()}
+        return x
+
     def _colorobject_check_input_arrays_(self, **kwargs):
         """Colorobject Check User Input
 
@@ -1847,64 +1856,40 @@ class colorobject:
             **kwargs: Named keywords, objects to be checked.
 
         Returns:
-            bool: Returns `True` if all checks where fine, throws an exception
+            dict: Returns a dictionary with the inputs as `numpy.ndarray`s
+            (float) if all checks where fine, throws an exception
             if the inputs do not fulfil the requirements.
         """
 
-        from numpy import asarray, float64
-
-        # Message will be dropped if problems occur
-        msg = f"Problem while checking inputs \"{', '.join(kwargs.keys())}\" " + \
-              f"to class \"{self.__class__.__name__}\"."
-
         res = {}
-        lengths = []
-        keys_to_check = []
         for key,val in kwargs.items():
             # No alpha provided, simply proceed
             if key == "alpha" and val is None: continue
 
-            keys_to_check.append(key)
-
-            # If is list: convert to ndarray no matter how long the element is
-            if isinstance(val, float) or isinstance(val, int):
-                val = np.asarray([val])
-            elif isinstance(val,list):
-                try:
-                    val = np.asarray(val)
-                except Exception as e:
-                    raise Exception(e)
-
-
-            # For alpha, R, G, and B: check range
-            if isinstance(self, RGB) or isinstance(self, sRGB):
-                if np.max(val) > 1. or np.max(val) < 0.:
-                    raise ValueError("wrong values specified for " + \
-                                     f"dimension {key} in {self.__class__.__name__}: " + \
-                                     "values have to lie within [0., 1.]")
-
-            # Check object type
-            from numpy import asarray
+            # Convert to numpy.ndarray (float); single numbers become arrays of length one
             try:
-                val = asarray(val)
+                val = np.asarray(val) if key == "hex_" else np.asarray(val, dtype = np.float64)
             except Exception as e:
                 raise ValueError(f"input {key} to {self.__class__.__name__}" + \
                                  f" could not have been converted to `numpy.ndarray`: {str(e)}")
-
-            # Else append length and proceed
-            lengths.append(len(val))
-
-            # Append to result vector
-            if isinstance(val, int) or isinstance(val, float): val = [val]
-            res[key] = val if key == "hex_" else asarray(val, float64)
+            res[key] = val.reshape(1) if val.ndim == 0 else val
 
         # Check if all do have the same length
-        if not np.all([x == lengths[0] for x in lengths]):
-            msg += " Arguments of different lengths: {:s}".format(
-                   ", ".join(["{:s} = {:d}".format(keys_to_check[i], lengths[i]) \
-                    for i in range(0, len(keys_to_check))]))
+        lengths = [len(x) for x in res.values()]
+        if any(x != lengths[0] for x in lengths):
+            msg = f"Problem while checking inputs \"{', '.join(kwargs.keys())}\" " + \
+                  f"to class \"{self.__class__.__name__}\". Arguments of different lengths: " + \
+                  ", ".join(["{:s} = {:d}".format(key, n) for key, n in zip(res.keys(), lengths)])
             raise ValueError(msg)
 
+        # For alpha, R, G, and B: check range
+        if isinstance(self, (RGB, sRGB)):
+            for key, val in res.items():
+                if val.size > 0 and (val.min() < 0. or val.max() > 1.):
+                    raise ValueError("wrong values specified for " + \
+                                     f"dimension {key} in {self.__class__.__name__}: " + \
+                                     "values have to lie within [0., 1.]")
+
         return res
 
 
@@ -1928,12 +1913,7 @@ class colorobject:
         Returns:
             bool: `True` if alpha values are present, `False` if not.
         """
-        if not "alpha" in self._data_.keys():
-            return False
-        elif self._data_["alpha"] is None:
-            return False
-        else:
-            return True
+        return self._data_.get("alpha") is not None
 
 
     def dropalpha(self):
@@ -2015,7 +1995,6 @@ class colorobject:
             >>> cols.specplot(rgb = True, hcl = True, palette = True)
 
         """
-        from copy import copy
         cols = copy(self)
         cols.to("hex")
 
@@ -2131,31 +2110,46 @@ class colorobject:
 
         """
 
-        from copy import copy
-        from numpy import ndarray, round
+        # HCL colors (e.g., palettes) are often converted over and over
+        # again; take them from the cache unless the object is large.
+        if type(self) is polarLUV and self.length() <= 1000:
+            key = [None if self._data_.get(x) is None else \
+                   np.asarray(self._data_[x], dtype = np.float64).tobytes() \
+                   for x in ("H", "C", "L", "alpha")]
+            colors = list(_polarLUV_colors_(*key, (self.WHITEX, self.WHITEY, self.WHITEZ),
+                                            self.GAMMA, fixup))
+        else:
+            colors = self._colors_(fixup)
 
-        x = copy(self)
-        x.to("hex", fixup = fixup)
+        return colors[::-1] if rev else colors
+
+    def _colors_(self, fixup):
+        """Extract Hex Colors
+
+        Helper method for :py:method:`colors`; converts a copy
+        of the current object to hex colors (adding alpha if needed).
+
+        Args:
+            fixup (bool): Whether or not to correct rgb values outside the
+                defined range of `[0., 1.]`.
+
+        Returns:
+            list: Returns a list of hex color strings.
+        """
+        x = self.to("hex", fixup = fixup, inplace = False)
         if x.hasalpha():
-            res = x.get("hex_").tolist()
-            # Appending alpha if alpha < 1.0
-            for i in range(0, len(res)):
-                if self._data_["alpha"][i] < 1.0:
-                    tmp = int(round(self._data_["alpha"][i] * 255. + 0.0001))
-                    res[i] += f"{tmp:02X}"
-            # Return hex with alpha
-            colors = res
+            # Appending alpha if alpha < 1.0 (missing alpha is nan)
+            idx    = self._data_["alpha"] < 1.0
+            alpha  = np.clip(np.round(self._data_["alpha"][idx] * 255. + 0.0001), 0, 255)
+            colors = np.asarray(x._data_["hex_"], dtype = object)
+            colors[idx] = colors[idx] + colorlib._HEX_PAIRS[alpha.astype(np.uint8)]
         else:
-            colors = x.get("hex_")
+            colors = x._data_["hex_"]
 
-        if rev:
-            from numpy import flip
-            colors = flip(colors)
+        return colors.tolist()
 
-        return colors.tolist() if isinstance(colors, ndarray) else colors
 
-
-    def get(self, dimname = None):
+    def get(self, dimname = None, copy = True):
         """Extracting Color Coordinates
 
         Allows to extract the current values of one or multiple dimensions
@@ -2166,6 +2160,10 @@ class colorobject:
             dimname (None, str): If `None` (default) values of all coordinates
                 of the current color object are returned. A specific coordinate
                 can be specified if needed.
+            copy (bool): If `True` (default) a copy of the coordinates is returned.
+                If `False` a read-only view is returned (a read-only `numpy.ndarray`
+                or a read-only mapping), avoiding the copy; the arrays must not
+                be modified.
 
         Returns:
             Returns a `numpy.ndarray` if coordinates of one specific dimension are
@@ -2194,13 +2192,16 @@ class colorobject:
 
         Raises:
             TypeError: If argument `dimname` is neither None or str.
+            TypeError: If argument `copy` is not bool.
             ValueError: If the dimension specified on `dimnames` does not exist.
         """
 
+        if not isinstance(copy, bool):
+            raise TypeError("argument `copy` must be bool")
+
         # Return all coordinates
-        from copy import copy
         if dimname is None:
-            return copy(self._data_)
+            return dict(self._data_) if copy else MappingProxyType(self._data_)
         # No string?
         elif not isinstance(dimname, str):
             raise TypeError("argument `dimname` must be None or str")
@@ -2213,7 +2214,15 @@ class colorobject:
             else:
                 raise ValueError(f"{self.__class__.__name__} has no dimension {dimname}")
 
-        return copy(self._data_[dimname])
+        res = self._data_[dimname]
+        if res is None:
+            return None
+        elif copy:
+            return res.copy()
+        # Read-only view
+        res = res.view()
+        res.flags.writeable = False
+        return res
 
 
     def set(self, **kwargs):
@@ -2250,36 +2259,26 @@ class colorobject:
             >>> cols
         """
         # Looping over inputs
-        from numpy import asarray, ndarray
         for key,vals in kwargs.items():
-            key.upper()
 
             # Check if the key provided by the user is a valid dimension
             # of the current object.
             if not key in self._data_.keys():
                 raise ValueError(f"{self.__class__.__name__} has no dimension {key}")
 
-            # In case the input is a single int/float or a list; try
-            # to convert the input into a numpy.array using the same
-            # dtype as the existing dimension (loaded via self.get(key)).
-            if isinstance(vals, (list, int, float)):
-                if isinstance(vals, (int, float)): vals = [vals]
-                t = type(self.get(key)[0]) # Current type (get current dimension)
-                try:
-                    vals = np.asarray(vals, dtype = t)
-                except Exception as e:
-                    raise ValueError(f"problems converting new data to {t} " + \
-                                     f" in {self.__class__.__name__}: {str(e)}")
-
-            # New values do have to have the same length as the old ones,
-            n = len(self.get(key))
-            t = type(self.get(key)[0])
+            # Convert the input (single int/float, list, or array) into
+            # a numpy.array using the same type as the existing dimension.
+            cur = self._data_[key]
+            t   = type(cur[0])
+            if isinstance(vals, (int, float)): vals = [vals]
             try:
                 vals = np.asarray(vals, dtype = t)
             except Exception as e:
                 raise ValueError(f"problems converting new data to {t} " + \
                                  f" in {self.__class__.__name__}: {str(e)}")
-            if not vals.size == n:
+
+            # New values do have to have the same length as the old ones
+            if not vals.size == len(cur):
                 raise ValueError("number of values to be stored on the object " + \
                                  f"{self.__class__.__name__} have to match the current dimension")
 
@@ -2310,7 +2309,10 @@ class colorobject:
             >>> [x3.length(), len(x3)]
 
         """
-        return max([0 if self._data_[x] is None else len(self._data_[x]) for x in self._data_.keys()])
+        # All dimensions are of the same length (ensured when set)
+        for x in self._data_.values():
+            if x is not None: return len(x)
+        return 0
 
     def __len__(self):
         return self.length()
@@ -2387,6 +2389,8 @@ class polarLUV(colorobject):
         >>> HCL(asarray([100, 80]), asarray([30, 50]), asarray([30, 80]))
     """
 
+    __slots__ = ()
+
     def __init__(self, H, C, L, alpha = None):
 
         # Checking inputs, save inputs on object
@@ -2396,7 +2400,7 @@ class polarLUV(colorobject):
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -2409,6 +2413,9 @@ class polarLUV(colorobject):
                 converted (e.g., `"CIEXYZ"`, `"HCL"`, `"hex"`, `"sRGB"`, ...).
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to `True`.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Examples:
 
@@ -2437,7 +2444,7 @@ class polarLUV(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -2446,34 +2453,13 @@ class polarLUV(colorobject):
 
         # This is the only transformation from polarLUV -> LUV
         elif to == "CIELUV":
-            [L, U, V] = clib.polarLUV_to_LUV(self.get("L"), self.get("C"), self.get("H"))
-            self._data_ = {"L" : L, "U" : U, "V" : V, "alpha" : self.get("alpha")}
+            [L, U, V] = clib.polarLUV_to_LUV(self._data_["L"], self._data_["C"], self._data_["H"])
+            self._data_ = {"L" : L, "U" : U, "V" : V, "alpha" : self._data_.get("alpha")}
             self.__class__ = CIELUV
 
-        # The rest are transformations along a path
-        elif to == "CIEXYZ":
-            via = ["CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "CIELAB":
-            via = ["CIELUV", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIELUV", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIELUV", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["CIELUV", "CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIELUV", "CIEXYZ", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         elif to in ["HLS", "HSV"]:
             self._ambiguous(self.__class__.__name__, to)
@@ -2485,6 +2471,32 @@ class polarLUV(colorobject):
 HCL = polarLUV
 
 
+@lru_cache(maxsize = 256)
+def _polarLUV_colors_(H, C, L, alpha, white, gamma, fixup):
+    """Cached Conversion of HCL Colors to Hex Colors
+
+    Used by :py:method:`colorobject.colors`; all arguments are hashable
+    to serve as key for the cache.
+
+    Args:
+        H (bytes): Hue, float64 array as bytes.
+        C (bytes): Chroma, float64 array as bytes.
+        L (bytes): Luminance, float64 array as bytes.
+        alpha (None, bytes): Alpha values, float64 array as bytes, or `None`.
+        white (tuple): White point (`X`, `Y`, `Z`).
+        gamma (float): Gamma used to adjust RGB.
+        fixup (bool): Whether or not to correct rgb values outside `[0., 1.]`.
+
+    Returns:
+        tuple: Hex color strings.
+    """
+    x = polarLUV(*[None if v is None else np.frombuffer(v, dtype = np.float64) \
+                   for v in (H, C, L, alpha)])
+    x.set_whitepoint(X = white[0], Y = white[1], Z = white[2])
+    x.GAMMA = gamma
+    return tuple(x._colors_(fixup))
+
+
 # -------------------------------------------------------------------
 # CIELUV color object
 # -------------------------------------------------------------------
@@ -2520,6 +2532,9 @@ class CIELUV(colorobject):
         >>> CIELUV(asarray([10, 30]), asarray([20, 80]), asarray([100, 40]))
 
     """
+
+    __slots__ = ()
+
     def __init__(self, L, U, V, alpha = None):
 
         # checking inputs, save inputs on object
@@ -2530,7 +2545,7 @@ class CIELUV(colorobject):
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -2543,6 +2558,9 @@ class CIELUV(colorobject):
                 converted (e.g., `"CIEXYZ"`, `"HCL"`, `"hex"`, `"sRGB"`, ...).
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to `True`.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Examples:
 
@@ -2570,7 +2588,7 @@ class CIELUV(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -2578,37 +2596,20 @@ class CIELUV(colorobject):
             return
         # Transformation from CIELUV -> CIEXYZ
         elif to == "CIEXYZ":
-            [X, Y, Z] = clib.LUV_to_XYZ(self.get("L"), self.get("U"), self.get("V"),
+            [X, Y, Z] = clib.LUV_to_XYZ(self._data_["L"], self._data_["U"], self._data_["V"],
                                         self.WHITEX, self.WHITEY, self.WHITEZ)
-            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self.get("alpha")}
+            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self._data_.get("alpha")}
             self.__class__ = CIEXYZ
 
         # Transformation from CIELUV -> polarLUV (HCL)
         elif to in ["HCL","polarLUV"]:
-            [L, C, H] = clib.LUV_to_polarLUV(self.get("L"), self.get("U"), self.get("V"))
-            self._data_ = {"L" : L, "C" : C, "H" : H, "alpha" : self.get("alpha")}
+            [L, C, H] = clib.LUV_to_polarLUV(self._data_["L"], self._data_["U"], self._data_["V"])
+            self._data_ = {"L" : L, "C" : C, "H" : H, "alpha" : self._data_.get("alpha")}
             self.__class__ = polarLUV
 
-        # The rest are transformations along a path
-        elif to == "CIELAB":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIEXYZ", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIEXYZ", "RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         elif to in ["HLS", "HSV"]:
             self._ambiguous(self.__class__.__name__, to)
@@ -2650,6 +2651,9 @@ class CIEXYZ(colorobject):
         >>> CIEXYZ(asarray([10, 0]), asarray([20, 80]), asarray([40, 40]))
 
     """
+
+    __slots__ = ()
+
     def __init__(self, X, Y, Z, alpha = None):
 
         # checking inputs, save inputs on object
@@ -2660,7 +2664,7 @@ class CIEXYZ(colorobject):
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -2673,6 +2677,9 @@ class CIEXYZ(colorobject):
                 converted (e.g., `"CIELUV"`, `"HCL"`, `"hex"`, `"sRGB"`, ...).
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to `True`.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Examples:
 
@@ -2700,7 +2707,7 @@ class CIEXYZ(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -2709,41 +2716,28 @@ class CIEXYZ(colorobject):
 
         # Transformation from CIEXYZ -> CIELUV
         elif to == "CIELUV":
-            [L, U, V] = clib.XYZ_to_LUV(self.get("X"), self.get("Y"), self.get("Z"),
+            [L, U, V] = clib.XYZ_to_LUV(self._data_["X"], self._data_["Y"], self._data_["Z"],
                                         self.WHITEX, self.WHITEY, self.WHITEZ) 
-            self._data_ = {"L" : L, "U" : U, "V" : V, "alpha" : self.get("alpha")}
+            self._data_ = {"L" : L, "U" : U, "V" : V, "alpha" : self._data_.get("alpha")}
             self.__class__ = CIELUV
 
         # Transformation from CIEXYZ -> CIELAB
         elif to == "CIELAB":
-            [L, A, B] = clib.XYZ_to_LAB(self.get("X"), self.get("Y"), self.get("Z"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ) 
-            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self.get("alpha")}
+            [L, A, B] = clib.XYZ_to_LAB(self._data_["X"], self._data_["Y"], self._data_["Z"],
+                                        self.WHITEX, self.WHITEY, self.WHITEZ, _check = False)
+            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = CIELAB
 
         # Transformation from CIEXYZ -> RGB
         elif to == "RGB":
-            [R, G, B] = clib.XYZ_to_RGB(self.get("X"), self.get("Y"), self.get("Z"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ) 
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
+            [R, G, B] = clib.XYZ_to_RGB(self._data_["X"], self._data_["Y"], self._data_["Z"],
+                                        self.WHITEX, self.WHITEY, self.WHITEZ, _check = False)
+            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = RGB
 
-        # The rest are transformations along a path
-        elif to == "polarLAB":
-            via = ["CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL", "polarLUV"]:
-            via = ["CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         elif to in ["HLS", "HSV"]:
             self._ambiguous(self.__class__.__name__, to)
@@ -2782,6 +2776,8 @@ class RGB(colorobject):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, R, G, B, alpha = None):
 
         # checking inputs, save inputs on object
@@ -2793,7 +2789,7 @@ class RGB(colorobject):
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -2806,6 +2802,9 @@ class RGB(colorobject):
                 converted (e.g., `"CIEXYZ"`, `"HCL"`, `"hex"`, `"sRGB"`, ...).
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to `True`.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Examples:
 
@@ -2832,7 +2831,7 @@ class RGB(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -2841,46 +2840,33 @@ class RGB(colorobject):
 
         # Transform from RGB -> sRGB
         elif to == "sRGB":
-            [R, G, B] = clib.RGB_to_sRGB(self.get("R"), self.get("G"), self.get("B"),
-                                           self.GAMMA)
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
+            [R, G, B] = clib.RGB_to_sRGB(self._data_["R"], self._data_["G"], self._data_["B"],
+                                           self.GAMMA, _check = False)
+            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = sRGB
 
         # Transform from RGB -> CIEXYZ
         elif to == "CIEXYZ":
-            [X, Y, Z] = clib.RGB_to_XYZ(self.get("R"), self.get("G"), self.get("B"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ)
-            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self.get("alpha")}
+            [X, Y, Z] = clib.RGB_to_XYZ(self._data_["R"], self._data_["G"], self._data_["B"],
+                                        self.WHITEX, self.WHITEY, self.WHITEZ, _check = False)
+            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self._data_.get("alpha")}
             self.__class__ = CIEXYZ
 
         # From RGB to HLS: take direct path (not via sRGB)
         elif to in ["HLS"]:
-            [H, L, S] = clib.RGB_to_HLS(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "L" : L, "S" : S, "alpha" : self.get("alpha")}
+            [H, L, S] = clib.RGB_to_HLS(self._data_["R"], self._data_["G"], self._data_["B"])
+            self._data_ = {"H" : H, "L" : L, "S" : S, "alpha" : self._data_.get("alpha")}
             self.__class__ = HLS
 
         # From RGB to HSV: take direct path (not via sRGB)
         elif to in ["HSV"]:
-            [H, S, V] = clib.RGB_to_HSV(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "S" : S, "V" : V, "alpha" : self.get("alpha")}
+            [H, S, V] = clib.RGB_to_HSV(self._data_["R"], self._data_["G"], self._data_["B"])
+            self._data_ = {"H" : H, "S" : S, "V" : V, "alpha" : self._data_.get("alpha")}
             self.__class__ = HSV
 
-        # The rest are transformations along a path
-        elif to in ["hex"]:
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIELUV", "CIELAB"]: 
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL","polarLUV"]:
-            via = ["CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         else: self._cannot(self.__class__.__name__, to)
 
@@ -2918,6 +2904,8 @@ class sRGB(colorobject):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, R, G, B, alpha = None, gamma = None):
 
         # checking inputs, save inputs on object
@@ -2931,7 +2919,7 @@ class sRGB(colorobject):
         if isinstance(gamma, float): self.GAMMA = gamma
 
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -2944,6 +2932,9 @@ class sRGB(colorobject):
                 converted (e.g., `"CIEXYZ"`, `"HCL"`, `"hex"`, `"sRGB"`, ...).
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to `True`.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Examples:
 
@@ -2970,7 +2961,7 @@ class sRGB(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -2979,45 +2970,32 @@ class sRGB(colorobject):
 
         # Transformation sRGB -> RGB
         elif to == "RGB":
-            [R, G, B] = clib.sRGB_to_RGB(self.get("R"), self.get("G"), self.get("B"),
-                                         gamma = self.GAMMA)
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
+            [R, G, B] = clib.sRGB_to_RGB(self._data_["R"], self._data_["G"], self._data_["B"],
+                                         gamma = self.GAMMA, _check = False)
+            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = RGB
 
         # Transformation sRGB -> hex
         elif to == "hex":
-            hex_ = clib.sRGB_to_hex(self.get("R"), self.get("G"), self.get("B"), fixup)
-            self._data_ = {"hex_" : hex_, "alpha" : self.get("alpha")}
+            hex_ = clib.sRGB_to_hex(self._data_["R"], self._data_["G"], self._data_["B"], fixup)
+            self._data_ = {"hex_" : hex_, "alpha" : self._data_.get("alpha")}
             self.__class__ = hexcols
 
         # Transform from RGB -> HLS
         elif to == "HLS":
-            [H, L, S] = clib.sRGB_to_HLS(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "L" : L, "S" : S, "alpha" : self.get("alpha")}
+            [H, L, S] = clib.sRGB_to_HLS(self._data_["R"], self._data_["G"], self._data_["B"])
+            self._data_ = {"H" : H, "L" : L, "S" : S, "alpha" : self._data_.get("alpha")}
             self.__class__ = HLS
 
         # Transform from RGB -> HSV
         elif to == "HSV":
-            [H, S, V] = clib.sRGB_to_HSV(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "S" : S, "V" : V, "alpha" : self.get("alpha")}
+            [H, S, V] = clib.sRGB_to_HSV(self._data_["R"], self._data_["G"], self._data_["B"])
+            self._data_ = {"H" : H, "S" : S, "V" : V, "alpha" : self._data_.get("alpha")}
             self.__class__ = HSV
 
-        # The rest are transformations along a path
-        elif to in ["CIEXYZ"]:
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIELUV", "CIELAB"]:
-            via = ["RGB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL","polarLUV"]:
-            via = ["RGB", "CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["RGB", "CIEXYZ", "CIELAB", to] 
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         else: self._cannot(self.__class__.__name__, to)
 
@@ -3055,6 +3033,8 @@ class CIELAB(colorobject):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, L, A, B, alpha = None):
 
         # checking inputs, save inputs on object
@@ -3065,7 +3045,7 @@ class CIELAB(colorobject):
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -3076,6 +3056,9 @@ class CIELAB(colorobject):
                 converted (e.g., `CIEXYZ`, `HCL`, `hex`, `RGB`, ...)
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to True.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Returns:
             No return, converts the object into a new color space and modifies
@@ -3083,7 +3066,7 @@ class CIELAB(colorobject):
             be of a different class.
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -3092,37 +3075,20 @@ class CIELAB(colorobject):
 
         # Transformations CIELAB -> CIEXYZ
         elif to == "CIEXYZ":
-            [X, Y, Z] = clib.LAB_to_XYZ(self.get("L"), self.get("A"), self.get("B"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ)
-            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self.get("alpha")}
+            [X, Y, Z] = clib.LAB_to_XYZ(self._data_["L"], self._data_["A"], self._data_["B"],
+                                        self.WHITEX, self.WHITEY, self.WHITEZ, _check = False)
+            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self._data_.get("alpha")}
             self.__class__ = CIEXYZ
 
         # Transformation CIELAB -> polarLAB
         elif to == "polarLAB":
-            [L, A, B] = clib.LAB_to_polarLAB(self.get("L"), self.get("A"), self.get("B"))
-            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self.get("alpha")}
+            [L, A, B] = clib.LAB_to_polarLAB(self._data_["L"], self._data_["A"], self._data_["B"])
+            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = polarLAB
 
-        # The rest are transformations along a path
-        elif to == "CIELUV":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL","polarLUV"]:
-            via = ["CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIEXYZ", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIEXYZ", "RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         elif to in ["HLS", "HSV"]:
             self._ambiguous(self.__class__.__name__, to)
@@ -3162,6 +3128,8 @@ class polarLAB(colorobject):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, L, A, B, alpha = None):
 
         # checking inputs, save inputs on object
@@ -3172,7 +3140,7 @@ class polarLAB(colorobject):
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -3185,6 +3153,9 @@ class polarLAB(colorobject):
                 converted (e.g., `"CIEXYZ"`, `"HCL"`, `"hex"`, `"sRGB"`, ...).
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to `True`.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Examples:
 
@@ -3212,7 +3183,7 @@ class polarLAB(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -3221,34 +3192,14 @@ class polarLAB(colorobject):
 
         # The only transformation we need is from polarLAB -> LAB
         elif to == "CIELAB":
-            [L, A, B] = clib.polarLAB_to_LAB(self.get("L"), self.get("A"), self.get("B"))
-            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self.get("alpha")}
+            [L, A, B] = clib.polarLAB_to_LAB(self._data_["L"], self._data_["A"], self._data_["B"])
+            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = CIELAB
 
         # The rest are transformationas along a path
-        elif to == "CIEXYZ":
-            via = ["CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "CIELUV":
-            via = ["CIELAB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL", "polarLUV"]:
-            via = ["CIELAB", "CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIELAB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIELAB", "CIEXYZ", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIELAB", "CIEXYZ", "RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         elif to in ["HLS", "HSV"]:
             self._ambiguous(self.__class__.__name__, to)
@@ -3296,6 +3247,8 @@ class HSV(colorobject):
         >>> cols
     """
 
+    __slots__ = ()
+
     def __init__(self, H, S, V, alpha = None):
 
         # checking inputs, save inputs on object
@@ -3306,7 +3259,7 @@ class HSV(colorobject):
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -3319,6 +3272,9 @@ class HSV(colorobject):
                 converted (e.g., `"CIEXYZ"`, `"HCL"`, `"hex"`, `"sRGB"`, ...).
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to `True`.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Examples:
 
@@ -3342,7 +3298,7 @@ class HSV(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -3351,23 +3307,19 @@ class HSV(colorobject):
 
         # The only transformation we need is back to RGB
         elif to == "sRGB":
-            [R, G, B] = clib.HSV_to_sRGB(self.get("H"), self.get("S"), self.get("V"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
+            [R, G, B] = clib.HSV_to_sRGB(self._data_["H"], self._data_["S"], self._data_["V"])
+            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = sRGB
 
         # From HLS to RGB: take direct path (not via sRGB)
         elif to in ["RGB"]:
-            [R, G, B] = clib.HSV_to_RGB(self.get("H"), self.get("S"), self.get("V"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
+            [R, G, B] = clib.HSV_to_RGB(self._data_["H"], self._data_["S"], self._data_["V"])
+            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = RGB
 
-        elif to == "hex":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "HLS":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         elif to in ["CIEXYZ", "CIELUV", "CIELAB", "polarLUV", "HCL", "polarLAB"]:
             self._ambiguous(self.__class__.__name__, to)
@@ -3414,6 +3366,8 @@ class HLS(colorobject):
         >>> cols
     """
 
+    __slots__ = ()
+
     def __init__(self, H, L, S, alpha = None):
 
         # checking inputs, save inputs on object
@@ -3424,7 +3378,7 @@ class HLS(colorobject):
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -3437,6 +3391,9 @@ class HLS(colorobject):
                 converted (e.g., `"CIEXYZ"`, `"HCL"`, `"hex"`, `"sRGB"`, ...).
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to `True`.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Examples:
 
@@ -3460,7 +3417,7 @@ class HLS(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -3469,23 +3426,19 @@ class HLS(colorobject):
 
         # The only transformation we need is back to RGB
         elif to == "sRGB":
-            [R, G, B] = clib.HLS_to_sRGB(self.get("H"), self.get("L"), self.get("S"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
+            [R, G, B] = clib.HLS_to_sRGB(self._data_["H"], self._data_["L"], self._data_["S"])
+            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = sRGB
 
         # From HSV to RGB: take direct path (not via sRGB)
         elif to in ["RGB"]:
-            [R, G, B] = clib.HLS_to_RGB(self.get("H"), self.get("L"), self.get("S"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
+            [R, G, B] = clib.HLS_to_RGB(self._data_["H"], self._data_["L"], self._data_["S"])
+            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self._data_.get("alpha")}
             self.__class__ = RGB
 
-        elif to == "hex":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "HSV":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         elif to in ["CIEXYZ", "CIELUV", "CIELAB", "polarLUV", "HCL", "polarLAB"]:
             self._ambiguous(self.__class__.__name__, to)
@@ -3534,10 +3487,11 @@ class hexcols(colorobject):
         >>> print(cols2) # default representation
     """
 
+    __slots__ = ()
+
     def __init__(self, hex_):
 
         from colorspace import check_hex_colors
-        import numpy as np
 
         # If hex_ is str, convert to list
         if isinstance(hex_, str): hex_ = [hex_]
@@ -3568,7 +3522,7 @@ class hexcols(colorobject):
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
+    def to(self, to, fixup = True, inplace = True):
         """Transform Color Space
 
         Allows to transform the current object into a different color space,
@@ -3584,6 +3538,9 @@ class hexcols(colorobject):
                 converted (e.g., `"CIEXYZ"`, `"HCL"`, `"HSL"`, `"sRGB"`, ...).
             fixup (bool): Whether or not colors outside the defined rgb color space
                 should be corrected if necessary, defaults to `True`.
+            inplace (bool): If `True` (default) the current object is converted.
+                If `False` the current object stays unchanged and a converted
+                copy is returned.
 
         Examples:
 
@@ -3607,7 +3564,7 @@ class hexcols(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
+        if not inplace: return self._to_copy_(to, fixup)
         clib = colorlib()
 
         # Nothing to do (converted to itself)
@@ -3616,36 +3573,15 @@ class hexcols(colorobject):
 
         # The only transformation we need is from hexcols -> sRGB
         elif to == "sRGB":
-            [R, G, B] = clib.hex_to_sRGB([None if x is None else x[0:7] for x in self.get("hex_")])
-            alpha = self.get("alpha")
+            [R, G, B] = clib.hex_to_sRGB([None if x is None else x[0:7] for x in self._data_["hex_"]])
+            alpha = self._data_.get("alpha")
             self._data_ = {"R": R, "G": G, "B": B}
             if alpha is not None: self._data_["alpha"] = alpha
             self.__class__ = sRGB
 
-        # The rest are transformations along a path
-        elif to == "RGB":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HLS", "HSV"]:
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIEXYZ"]:
-            via = ["sRGB", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIELUV", "CIELAB"]:
-            via = ["sRGB", "RGB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL", "polarLUV"]:
-            via = ["sRGB", "RGB", "CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in "polarLAB":
-            via = ["sRGB", "RGB", "CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # The rest are transformations along a path, see _VIA
+        elif (self.__class__.__name__, to) in _VIA:
+            self._transform_via_path_(_VIA[(self.__class__.__name__, to)], fixup = fixup)
 
         else: self._cannot(self.__class__.__name__, to)
 
@@ -3764,8 +3700,6 @@ def compare_colors(a, b, exact = False, _all = True, atol = None):
         ValueError: If `atol` is not larger than 0.
     """
 
-    from numpy import sqrt, isclose
-
     if not isinstance(a, colorobject):
         raise TypeError("argument `a` must be an object based on colorspace.colorlib.colorobject")
     if not isinstance(b, colorobject):
@@ -3800,7 +3734,7 @@ def compare_colors(a, b, exact = False, _all = True, atol = None):
             else:
                 dist += 100.
 
-        return sqrt(dist)
+        return np.sqrt(dist)
 
     # Compare hex colors; always on string level
     if isinstance(a, hexcols):
@@ -3813,7 +3747,7 @@ def compare_colors(a, b, exact = False, _all = True, atol = None):
         # HEX precision in RGB coordinates is about sqrt((1./255.)**2 * 3) / 2 = 0.003396178
         if not atol: atol = 0.005
         res = [distance(a[i], b[i]) for i in range(0, a.length())]
-        res = isclose(res, 0, atol = atol)
+        res = np.isclose(res, 0, atol = atol)
     # HCL or polarLUV (both return instance polarLUV)
     # TODO(enhancement): Calculating the Euclidean distance on HCL and (if
     #   available) alpha which itself is in [0, 1]. Should be weighted
@@ -3823,15 +3757,84 @@ def compare_colors(a, b, exact = False, _all = True, atol = None):
 
         if not atol: atol = 1
         res = [distance(a[i], b[i]) for i in range(0, a.length())]
-        res = isclose(res, 0, atol = atol)
+        res = np.isclose(res, 0, atol = atol)
 
 
     # If _all is True: check if all elements are True
     if _all:
-        from numpy import all
-        res = all(res)
+        res = np.all(res)
     return res
 
 
+def batch_to(objs, to, fixup = True, inplace = True):
+    """Transform Multiple Color Objects
 
+    Converts a series of color objects into the color space `to`, the
+    same as calling the :py:func:`to` method on each object. Objects of the same
+    class (as well as same white point, gamma, and alpha handling) are
+    concatenated and converted at once, which is considerably faster when
+    converting many small objects (e.g., a series of palettes).
 
+    Args:
+        objs (list): List of objects which inherit from `colorobject`.
+        to (str): Name of the color space into which the colors should be
+            converted (e.g., `"CIEXYZ"`, `"HCL"`, `"hex"`, `"sRGB"`, ...).
+        fixup (bool): Whether or not colors outside the defined rgb color space
+            should be corrected if necessary, defaults to `True`.
+        inplace (bool): If `True` (default) the objects are converted.
+            If `False` the objects stay unchanged and a list of converted
+            copies is returned.
+
+    Returns:
+        None, list: No return if `inplace = True`, else a list of new color
+        objects of the target color space.
+
+    Example:
+
+        >>> from colorspace import batch_to, hexcols, sequential_hcl, qualitative_hcl
+        >>> x = [hexcols(sequential_hcl()(5)), hexcols(qualitative_hcl()(3))]
+        >>> batch_to(x, "HCL")
+        >>> x
+        >>> #: Converted copies, leaving `x` unchanged
+        >>> y = batch_to(x, "sRGB", inplace = False)
+        >>> y
+
+    Raises:
+        TypeError: If `objs` is not a list or tuple of objects which inherit
+            from `colorobject`.
+        TypeError: If `fixup` or `inplace` are not bool.
+    """
+    if not isinstance(objs, (list, tuple)) or \
+       not all(isinstance(x, colorobject) for x in objs):
+        raise TypeError("argument `objs` must be a list of objects based on colorspace.colorlib.colorobject")
+    if not isinstance(fixup, bool):
+        raise TypeError("argument `fixup` must be bool")
+    if not isinstance(inplace, bool):
+        raise TypeError("argument `inplace` must be bool")
+
+    if not inplace: objs = [x._copy_() for x in objs]
+
+    # Grouping objects which can be converted together
+    groups = {}
+    for x in objs:
+        key = (type(x), x.WHITEX, x.WHITEY, x.WHITEZ, x.GAMMA, x.hasalpha())
+        groups.setdefault(key, []).append(x)
+
+    for group in groups.values():
+        if len(group) == 1:
+            group[0].to(to, fixup = fixup)
+            continue
+
+        # Concatenate, convert, and split into the original objects
+        res  = copy(group[0])
+        dims = [k for k,v in res._data_.items() if v is not None]
+        res._data_ = {k: np.concatenate([x._data_[k] for x in group]) if k in dims else None \
+                      for k in res._data_}
+        res.to(to, fixup = fixup)
+
+        offsets = np.cumsum([0] + [x.length() for x in group])
+        for x,i,j in zip(group, offsets[:-1], offsets[1:]):
+            x._data_ = {k: None if v is None else v[i:j] for k,v in res._data_.items()}
+            x.__class__ = res.__class__
+
+    if not inplace: return objs
@@ -55,7 +55,6 @@ def cvd_image(image = "DEMO", cvd = "desaturate", severity = 1.0,
     """
 
     import os
-    import inspect
 
     # Conver to ..?
     allowed = ["protan", "tritan", "deutan", "desaturate", "original"]
@@ -96,14 +95,16 @@ def cvd_image(image = "DEMO", cvd = "desaturate", severity = 1.0,
     except Exception as e:
         raise IOError(str(e))
 
-    # Extracting colors (scale from [0,255] to [0.,1.])
+    # Extracting colors (scale from [0,255] to [0.,1.]). The image is
+    # reordered once into one contiguous row per channel.
+    from numpy import moveaxis, ascontiguousarray
+    chans = ascontiguousarray(moveaxis(img, 2, 0).reshape((img.shape[2], -1)),
+                              dtype = float) / 255.
     data = {}
     if img.shape[2] == 3:
-        [data["R"], data["G"], data["B"]] = \
-                [img[:,:,i].flatten() / 255. for i in [0,1,2]]
+        [data["R"], data["G"], data["B"]] = chans
     elif img.shape[2] == 4:
-        [data["R"], data["G"], data["B"], data["alpha"]] = \
-                [img[:,:,i].flatten() / 255. for i in [0,1,2,3]]
+        [data["R"], data["G"], data["B"], data["alpha"]] = chans
 
     # Create sRGB with or without
     from .colorlib import sRGB
@@ -155,11 +156,11 @@ def cvd_image(image = "DEMO", cvd = "desaturate", severity = 1.0,
         # Create new image matrix and fill in the data
         from numpy import ndarray, uint8
         imnew = ndarray(shape, dtype = uint8)
-        imnew[:,:,0] = fun(cols.get("R"), shape[0:2])
-        imnew[:,:,1] = fun(cols.get("G"), shape[0:2])
-        imnew[:,:,2] = fun(cols.get("B"), shape[0:2])
+        imnew[:,:,0] = fun(cols.get("R", copy = False), shape[0:2])
+        imnew[:,:,1] = fun(cols.get("G", copy = False), shape[0:2])
+        imnew[:,:,2] = fun(cols.get("B", copy = False), shape[0:2])
         if cols.hasalpha():
-            imnew[:,:,3] = fun(cols.get("alpha"), shape[0:2])
+            imnew[:,:,3] = fun(cols.get("alpha", copy = False), shape[0:2])
 
         import matplotlib.pyplot as plt
         plt.imshow(imnew)
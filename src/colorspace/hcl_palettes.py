@@ -149,8 +149,7 @@ def hcl_palettes(n = 5, type_ = None, name = None, plot = False, custom = None,
         from numpy import all
         from .palettes import defaultpalette
         def customerror():
-            import inspect
-            str = "List with custom palettes provided to {:s}".format(inspect.stack()[0][3])
+            str = "List with custom palettes provided to hcl_palettes"
             str += " but not all elements are of type defaultpalette"
             raise TypeError(str)
 
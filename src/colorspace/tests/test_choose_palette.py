@@ -0,0 +1,29 @@
+
+from colorspace.choose_palette import gui
+from types import SimpleNamespace
+
+# ------------------------------------------
+# Loading/storing GUI settings. Uses a simple stand-in object
+# for the gui as setting up the Tk interface requires a display.
+# ------------------------------------------
+def test_gui_settings():
+
+    obj = SimpleNamespace(_setting_names = gui._setting_names,
+                          _settings = {"h1": 260, "h2": 0, "n": 7})
+
+    # Single setting
+    assert gui.settings(obj, "h1") == 260
+
+    # Multiple settings
+    assert gui.settings(obj, "h1", "h2") == {"h1": 260, "h2": 0}
+
+    # Non-str and unknown keys are ignored
+    assert gui.settings(obj, "h1", 3, "foo", "n") == {"h1": 260, "n": 7}
+
+    # Storing settings (unknown keys ignored)
+    gui.settings(obj, h2 = 30, foo = 1)
+    assert obj._settings == {"h1": 260, "h2": 30, "n": 7}
+
+    # No input: returns all settings
+    assert gui.settings(obj) is obj._settings
+
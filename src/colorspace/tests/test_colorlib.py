@@ -332,6 +332,22 @@ def test_convert_color_spaces():
     x.to("RGB"); x.to("hex")
     assert compare_colors(colors_to_test, x)
 
+def test_convert_not_inplace():
+    x = deepcopy(colors_to_test)
+    y = x.to("HCL", inplace = False)
+    assert isinstance(x, hexcols) and isinstance(y, polarLUV)
+    assert x.colors() == colors_to_test.colors()
+    z = y.to("sRGB", inplace = False); z = z.to("hex", inplace = False)
+    assert isinstance(y, polarLUV) and isinstance(z, hexcols)
+    assert compare_colors(colors_to_test, z)
+    # Converting to itself returns an independent copy
+    y = x.to("hex", inplace = False)
+    assert y is not x
+    y.set(hex_ = ["#000000"] * y.length())
+    assert x.colors() == colors_to_test.colors()
+    # In-place conversion returns nothing
+    assert x.to("HCL") is None and isinstance(x, polarLUV)
+
 ## We are using a shortcut from RGB to HLS and back
 def test_shortcut_RGB_HLS():
     from colorspace import rainbow
@@ -405,6 +421,10 @@ def test_colorlib_gtrans():
     gamma2 = asarray([0.1, 0.1])
     with pytest.raises(ValueError): clib.gtrans(u3, gamma2)
 
+    # 8-bit input is looked up, identical to the float input u / 255
+    u8 = asarray([0, 1, 10, 128, 255], dtype = "uint8")
+    assert np.allclose(clib.gtrans(u8, 2.4), clib.gtrans(u8 / 255., 2.4))
+
 
 def test_colorlib_ftrans():
 
@@ -431,6 +451,24 @@ def test_colorlib_ftrans():
     gamma2 = asarray([0.1, 0.1])
     with pytest.raises(ValueError): clib.ftrans(u3, gamma2)
 
+    # 8-bit input is looked up, identical to the float input u / 255
+    u8 = asarray([0, 1, 10, 128, 255], dtype = "uint8")
+    assert np.allclose(clib.ftrans(u8, 2.4), clib.ftrans(u8 / 255., 2.4))
+
+def test_colorlib_sRGB_to_hex_uint8():
+
+    from numpy import asarray
+    from colorspace import colorlib
+    clib = colorlib()
+
+    # 8-bit input is looked up, identical to the float input x / 255
+    r = asarray([0, 255,  16, 128], dtype = "uint8")
+    g = asarray([0,   0, 171,  64], dtype = "uint8")
+    b = asarray([0, 255, 205,   1], dtype = "uint8")
+    res = clib.sRGB_to_hex(r, g, b)
+    assert res.tolist() == ["#000000", "#FF00FF", "#10ABCD", "#804001"]
+    assert np.all(res == clib.sRGB_to_hex(r / 255., g / 255., b / 255.))
+
 # --------------------------------------------
 # --------------------------------------------
 # Testing standard representation (only that we get a string)
@@ -480,6 +518,10 @@ def test_sRGB_RGB_value_limits():
     with pytest.raises(ValueError): RGB(0, 0, 0, alpha = -0.0001)
     with pytest.raises(ValueError): RGB(0, 0, 0, alpha = 1.0001)
 
+    # Negative values are also detected if not all values are negative
+    with pytest.raises(ValueError): sRGB([0.5, -0.001], [0, 0], [0, 0])
+    with pytest.raises(ValueError): RGB([0, 0], [0, 0], [0, 0], alpha = [0.5, -0.001])
+
 def test_dimensions_of_different_lengths():
     with pytest.raises(ValueError): RGB(0.1, 0.2, [0.3, 0,4]) # Unequal length
     with pytest.raises(ValueError): RGB(0.1, [0.2, 0.3], 0,4) # Unequal length
@@ -606,6 +648,25 @@ def test_get_colors():
     assert all([isinstance(col, str) for col in x.colors()])
     assert x.length() == len(x.colors())
 
+# HCL colors are cached by coordinates, white point, gamma, and fixup
+def test_get_colors_HCL_cached():
+    x = polarLUV([275, 314, 353], [70, 85, 102], [25, 40, 55], alpha = [1., 0.5, 0.2])
+    res = x.colors()
+    assert res == x._colors_(True)
+    assert x.colors(rev = True) == res[::-1]
+
+    # Returns a new list on each call
+    res[0] = "changed"
+    assert x.colors()[0] != "changed"
+
+    # Changing the coordinates or the white point changes the colors
+    y = deepcopy(x)
+    y.set(L = [30, 40, 55])
+    assert y.colors() == y._colors_(True) and y.colors()[0] != x.colors()[0]
+    y = deepcopy(x)
+    y.set_whitepoint(X = 90.)
+    assert y.colors() == y._colors_(True) and y.colors()[0] != x.colors()[0]
+
 def test_dimensions_must_be_of_same_length():
 
     with pytest.raises(ValueError): RGB(1, 0, [1, 0])
@@ -634,6 +695,25 @@ def test_get_and_set_method():
     raises(ValueError, x.set, R = [0.3, 0.5])
     raises(ValueError, x.set, R = np.asarray([0.3, 0.5]))
 
+def test_get_without_copy():
+    x = polarLUV([260, 80], [80, 0], [30, 90], [1, 0.6])
+
+    # Copies (default) can be modified without affecting the object
+    h = x.get("H"); h[0] = 0.
+    d = x.get();    d["H"] = None
+    assert x.get("H")[0] == 260. and x.get("H") is not None
+
+    # Read-only views
+    h = x.get("H", copy = False)
+    assert np.all(h == x.get("H")) and not h.flags.writeable
+    with raises(ValueError): h[0] = 0.
+    d = x.get(copy = False)
+    assert set(d.keys()) == set(x.get().keys())
+    with raises(TypeError): d["H"] = None
+    assert polarLUV(1, 2, 3).get("alpha", copy = False) is None
+
+    raises(TypeError, x.get, "H", copy = 1)
+
 def test_get_coords():
     cols = hexcols(["#00ff0010", "#ff0033"])
 
@@ -715,6 +795,30 @@ def test_misuse_whitepoint():
     x = RGB(1, 0.5, 0); x.WHITEX = [1, 2]; x.WHITEZ = ["a", "b", "c"]
     raises(ValueError, x.to, to = "CIEXYZ")
 
+# RGB <-> CIEXYZ only scales with the Y component of the whitepoint
+def test_RGB_XYZ_whitepoint_Y_only():
+    clib = colorlib()
+    R = np.asarray([1., 0.5, 0.]); G = np.asarray([1., 0.2, 0.]); B = np.asarray([1., 0.9, 0.])
+    ref = clib.RGB_to_XYZ(R, G, B)
+    # RGB white maps onto the default white point
+    assert np.allclose([x[0] for x in ref], [95.047, 100., 108.883], atol = 0.01)
+    # XN and ZN do not change the result, YN scales it
+    res = clib.RGB_to_XYZ(R, G, B, XN = 10., YN = 100., ZN = 10.)
+    assert all(np.array_equal(x, y) for x, y in zip(ref, res))
+    res = clib.RGB_to_XYZ(R, G, B, YN = 50.)
+    assert all(np.allclose(x / 2., y) for x, y in zip(ref, res))
+    # And back
+    res = clib.XYZ_to_RGB(*ref, XN = 10., ZN = 10.)
+    assert all(np.allclose(x, y) for x, y in zip([R, G, B], res))
+
+# Scalar white points are cached as read-only arrays of length one
+def test_get_white_cached():
+    clib = colorlib()
+    res = clib._get_white_("test", 3, 90., None, 110.)
+    assert [x.tolist() for x in res] == [[90.], [100.], [110.]]
+    assert all(x is y for x, y in zip(res, clib._get_white_("test", 5, 90., None, 110.)))
+    assert not res[0].flags.writeable
+
 # --------------------------------------------
 # Plotting ..
 # --------------------------------------------
@@ -756,3 +860,27 @@ def test_colorlib_hclplot_method():
 
 
 
+
+def test_batch_to():
+    from colorspace import batch_to
+    x = [deepcopy(colors_to_test), deepcopy(colors_to_test_with_alpha),
+         hexcols(["#ff0000"]), sRGB([0.1, 0.5], [0.2, 0.5], [0.3, 0.5])]
+    ref = deepcopy(x)
+    for r in ref: r.to("HCL")
+
+    # Returns converted copies
+    y = batch_to(x, "HCL", inplace = False)
+    assert [type(v) for v in x] == [hexcols, hexcols, hexcols, sRGB]
+    assert all(isinstance(v, polarLUV) for v in y)
+    assert all(compare_colors(a, b, exact = True) for a,b in zip(ref, y))
+
+    # In-place conversion
+    assert batch_to(x, "HCL") is None
+    assert all(compare_colors(a, b, exact = True) for a,b in zip(ref, x))
+    assert [v.length() for v in x] == [8, 8, 1, 2]
+    assert x[1].hasalpha() and not x[0].hasalpha()
+
+    raises(TypeError, batch_to, colors_to_test, "HCL")
+    raises(TypeError, batch_to, [colors_to_test, "#ff0000"], "HCL")
+    raises(TypeError, batch_to, [colors_to_test], "HCL", fixup = 1)
+    raises(TypeError, batch_to, [colors_to_test], "HCL", inplace = 1)